@@ -7,6 +7,7 @@ through the LLM scaffold.
 
 Usage:
     python scripts/generate_analysis.py input_ir.json output_dir
+    python scripts/generate_analysis.py input_ir.json output_dir --tasks A,B,C,D,E,F
     python scripts/generate_analysis.py --interactive
     python scripts/generate_analysis.py --demo
 
@@ -18,24 +19,58 @@ Output Files:
     - risk_and_assumptions.md (caveats and limitations)
 """
 
+import hashlib
+import importlib.util
 import json
-import os
+import re
 import sys
 import argparse
+import asyncio
+import csv
+import io
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from string import Template
+from typing import Callable, Dict, List, Optional, Tuple
 
-# Try to import anthropic, but don't fail if not available
+# anthropic is imported lazily (see _get_anthropic): it pulls in httpx and
+# pydantic, which --demo and --no-llm runs never need
+HAS_ANTHROPIC = importlib.util.find_spec('anthropic') is not None
+_ANTHROPIC = None
+
+# Prefer orjson for IR (de)serialization, fall back to the stdlib
 try:
-    import anthropic
-    HAS_ANTHROPIC = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_ANTHROPIC = False
+    HAS_ORJSON = False
 
 
 SCAFFOLD_DIR = Path(__file__).parent.parent / "llm-scaffold"
 OUTPUT_TEMPLATES_DIR = SCAFFOLD_DIR / "output-templates"
+FALLBACK_TEMPLATES_DIR = Path(__file__).parent / "templates"
+LLM_CACHE_DIR = Path.home() / ".cache" / "first-principles-attribution" / "llm"
+
+# Analysis tasks defined in analysis-prompts.md
+TASK_CHOICES = ('A', 'B', 'C', 'D', 'E', 'F', 'G')
+
+# Files every analysis run produces
+REQUIRED_FILES = (
+    'executive_summary.md',
+    'model_decomposition.md',
+    'diagrams.mmd',
+    'viz_spec.json',
+    'risk_and_assumptions.md',
+)
+
+# Fallback output templates, read and compiled once at import
+_TEMPLATES = {
+    name: Template((FALLBACK_TEMPLATES_DIR / name).read_text(encoding='utf-8'))
+    for name in ('executive_summary.md', 'model_decomposition.md',
+                 'diagrams.mmd', 'risk_and_assumptions.md')
+}
 
 
 def load_system_prompt() -> str:
@@ -52,10 +87,89 @@ def load_analysis_prompts() -> str:
         return f.read()
 
 
+def to_json(data: Dict, compact: bool = False) -> str:
+    """Serialize data as JSON (orjson when available).
+
+    Indented by default; ``compact`` drops all insignificant whitespace.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option).decode()
+    if compact:
+        return json.dumps(data, separators=(',', ':'), default=str)
+    return json.dumps(data, indent=2, default=str)
+
+
+# Per-channel IR sections flattened into the prompt's channel table
+_CHANNEL_SECTIONS = ('confidence_intervals', 'rank_stability')
+
+
+def compact_ir_for_prompt(ir_data: Dict) -> str:
+    """
+    Encode IR data for the prompt with far fewer tokens than indented JSON.
+
+    Scalar metadata becomes YAML-style front matter, ``hybrid_share`` and the
+    per-channel sections become one CSV row per channel (columns are the union
+    of their keys, empty cells mean absent), and anything else is appended
+    as compact JSON. Values are JSON-encoded so nothing is lost.
+    """
+    sections = {'hybrid_share': ir_data.get('hybrid_share') or {}}
+    for name in _CHANNEL_SECTIONS:
+        section = ir_data.get(name)
+        if isinstance(section, dict) and all(
+            isinstance(v, dict) and not any(isinstance(x, (dict, list)) for x in v.values())
+            for v in section.values()
+        ):
+            sections[name] = section
+
+    channels = dict.fromkeys(sections['hybrid_share'])
+    for name in _CHANNEL_SECTIONS:
+        channels.update(dict.fromkeys(sections.get(name, {})))
+    keyed = [
+        (name, key)
+        for name in _CHANNEL_SECTIONS
+        for key in dict.fromkeys(
+            k for values in sections.get(name, {}).values() for k in values
+        )
+    ]
+    # Qualify a column with its section only when the key is ambiguous
+    counts = Counter(key for _, key in keyed)
+    header = [key if counts[key] == 1 else f"{name}.{key}" for name, key in keyed]
+
+    lines = ['---']
+    rest = {}
+    for key, value in ir_data.items():
+        if key in sections:
+            continue
+        if isinstance(value, (dict, list)):
+            rest[key] = value
+        else:
+            lines.append(f"{key}: {to_json(value, compact=True)}")
+    lines.append('---')
+
+    table = io.StringIO()
+    writer = csv.writer(table, lineterminator='\n')
+    writer.writerow(['channel', 'share'] + header)
+    share = sections['hybrid_share']
+    for channel in channels:
+        row = [channel, to_json(share[channel], compact=True) if channel in share else '']
+        for name, key in keyed:
+            values = sections.get(name, {}).get(channel) or {}
+            row.append(to_json(values[key], compact=True) if key in values else '')
+        writer.writerow(row)
+    lines.append(table.getvalue().rstrip('\n'))
+
+    if rest:
+        lines.append(to_json(rest, compact=True))
+    return '\n'.join(lines)
+
+
 def load_ir_artifact(filepath: str) -> Dict:
     """Load and validate IR artifact."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    raw = Path(filepath).read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     
     # Validate required fields
     required = ['ir_version', 'hybrid_share', 'confidence_intervals']
@@ -101,8 +215,8 @@ Please analyze the following IR artifact and generate the appropriate outputs.
 {ir_summary}
 
 ### Full IR Data
-```json
-{json.dumps(ir_data, indent=2, default=str)}
+```
+{compact_ir_for_prompt(ir_data)}
 ```
 
 Please provide your analysis following the format specified in the task.
@@ -113,90 +227,296 @@ Please provide your analysis following the format specified in the task.
 
 def format_ir_summary(ir_data: Dict) -> str:
     """Format IR data into a readable summary for the prompt."""
-    summary = []
-    summary.append(f"**Version:** {ir_data.get('ir_version', 'unknown')}")
-    summary.append(f"**Generated:** {ir_data.get('generated_at', 'unknown')}")
+    ci_all = ir_data.get('confidence_intervals') or {}
+    summary = [
+        f"**Version:** {ir_data.get('ir_version', 'unknown')}",
+        f"**Generated:** {ir_data.get('generated_at', 'unknown')}",
+    ]
     
     if 'alpha' in ir_data:
         summary.append(f"**Alpha (causality/fairness blend):** {ir_data['alpha']}")
     
     # Attribution shares
     if 'hybrid_share' in ir_data:
+        rows = sorted(ir_data['hybrid_share'].items(), key=itemgetter(1), reverse=True)
         summary.append("\n**Channel Attribution (Hybrid):**")
-        for ch, share in sorted(ir_data['hybrid_share'].items(), key=lambda x: -x[1]):
-            ci = ir_data.get('confidence_intervals', {}).get(ch, {})
-            p05 = ci.get('p05', 'N/A')
-            p95 = ci.get('p95', 'N/A')
-            summary.append(f"  - {ch}: {share:.1%} [90% CI: {p05:.0%}-{p95:.0%}]")
+        summary.extend([
+            f"  - {ch}: {share:.1%} [90% CI: {ci.get('p05', 0):.0%}-{ci.get('p95', 0):.0%}]"
+            for ch, share in rows
+            for ci in (ci_all.get(ch) or {},)
+        ])
     
     # Rank stability
     if 'rank_stability' in ir_data:
+        rows = sorted(ir_data['rank_stability'].items(),
+                      key=lambda x: -x[1].get('top1', 0))
         summary.append("\n**Rank Stability:**")
-        for ch, stability in sorted(ir_data['rank_stability'].items(), 
-                                     key=lambda x: -x[1].get('top1', 0)):
-            summary.append(f"  - {ch}: #1={stability.get('top1', 0):.0%}, #2={stability.get('top2', 0):.0%}")
+        summary.extend([
+            f"  - {ch}: #1={stability.get('top1', 0):.0%}, #2={stability.get('top2', 0):.0%}"
+            for ch, stability in rows
+        ])
     
     return '\n'.join(summary)
 
 
-def call_llm(prompt: str, model: str = "claude-sonnet-4-20250514") -> str:
-    """Call LLM API with the prompt."""
-    if not HAS_ANTHROPIC:
-        raise RuntimeError(
-            "Anthropic SDK not installed. Install with: pip install anthropic"
-        )
-    
-    client = anthropic.Anthropic()
-    
-    response = client.messages.create(
+def _get_anthropic():
+    """Import the Anthropic SDK on first use and cache the module."""
+    global _ANTHROPIC
+    if _ANTHROPIC is None:
+        try:
+            import anthropic
+        except ImportError:
+            raise RuntimeError(
+                "Anthropic SDK not installed. Install with: pip install anthropic"
+            )
+        _ANTHROPIC = anthropic
+    return _ANTHROPIC
+
+
+def llm_cache_path(model: str, system: str, prompt: str) -> Path:
+    """Content-addressed cache location for an LLM response."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (model, system, prompt):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return LLM_CACHE_DIR / f"{h.hexdigest()}.md"
+
+
+def call_llm(
+    prompt: str,
+    model: str = "claude-sonnet-4-20250514",
+    on_chunk: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True
+) -> str:
+    """
+    Call LLM API with the prompt, streaming the response.
+
+    Text deltas are passed to ``on_chunk`` as they arrive so callers can
+    show progress or start parsing before the response is complete.
+    Responses are cached on disk keyed by model, system prompt and prompt
+    (which embeds the task and IR data); a cache hit skips the API call.
+    """
+    system = load_system_prompt()
+    cache_path = llm_cache_path(model, system, prompt)
+    if use_cache and cache_path.exists():
+        text = cache_path.read_text(encoding='utf-8')
+        if on_chunk is not None:
+            on_chunk(text)
+        return text
+
+    client = _get_anthropic().Anthropic()
+    chunks = []
+    
+    with client.messages.stream(
         model=model,
-        system=load_system_prompt(),
+        system=system,
         messages=[{
             "role": "user",
             "content": prompt
         }],
         max_tokens=8192
-    )
-    
-    return response.content[0].text
+    ) as stream:
+        for text in stream.text_stream:
+            chunks.append(text)
+            if on_chunk is not None:
+                on_chunk(text)
+    
+    response = ''.join(chunks)
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(response, encoding='utf-8')
+    return response
+
+
+async def call_llm_async(
+    prompt: str,
+    model: str = "claude-sonnet-4-20250514",
+    use_cache: bool = True
+) -> str:
+    """
+    Async variant of ``call_llm`` so several tasks can run concurrently.
 
+    Shares the on-disk response cache with ``call_llm``.
+    """
+    system = load_system_prompt()
+    cache_path = llm_cache_path(model, system, prompt)
+    if use_cache and cache_path.exists():
+        return cache_path.read_text(encoding='utf-8')
 
-def parse_llm_output(content: str) -> Dict[str, str]:
-    """Parse LLM output into separate files."""
-    files = {}
-    
-    # Try to extract code blocks with file markers
-    lines = content.split('\n')
-    current_file = None
-    current_content = []
-    
-    for line in lines:
-        # Check for file markers
-        if line.startswith('```markdown') or line.startswith('```'):
-            # New file starting
-            continue
-        elif line.startswith('```') and current_file:
-            # End of current file
-            files[current_file] = '\n'.join(current_content)
-            current_file = None
-            current_content = []
-        elif line.startswith('File: ') and current_file is None:
-            # Start of new file
-            filename = line.replace('File: ', '').strip()
-            # Remove file extension if present
-            if not filename.endswith('.md') and not filename.endswith('.json'):
+    client = _get_anthropic().AsyncAnthropic()
+    chunks = []
+
+    async with client.messages.stream(
+        model=model,
+        system=system,
+        messages=[{
+            "role": "user",
+            "content": prompt
+        }],
+        max_tokens=8192
+    ) as stream:
+        async for text in stream.text_stream:
+            chunks.append(text)
+
+    response = ''.join(chunks)
+    if use_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(response, encoding='utf-8')
+    return response
+
+
+def _echo_chunk(text: str) -> None:
+    """Write a streamed chunk to stdout immediately (CLI progress)."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+# Marker lines recognised in LLM output: code fences, "File: <name>" and
+# "## <Section>" headings. One pass of this pattern replaces per-line
+# startswith checks.
+_MARKER_RE = re.compile(
+    r'^(?:```(?P<lang>[\w-]*)[ \t\r]*'
+    r'|File:[ \t]*(?P<fname>\S.*?)[ \t\r]*'
+    r'|##[ \t]+(?P<section>.*?)[ \t\r]*)$',
+    re.MULTILINE
+)
+
+
+class StreamingOutputParser:
+    """
+    Incremental parser that splits LLM output into separate files.
+
+    Text is fed in chunks as it streams from the API. Each ``feed`` call
+    only scans the complete lines added since the previous call, so the
+    total work is linear in the response length. Files are delimited by a
+    ``File: <name>`` line followed by a fenced code block; unmarked output
+    falls back to its ``## `` sections.
+
+    If ``on_file`` is given it is called with ``(filename, content)`` as
+    soon as each file is complete, so consumers can render results before
+    the response finishes.
+    """
+
+    def __init__(self, on_file: Optional[Callable[[str, str], None]] = None):
+        self.on_file = on_file
+        self.buffer = ''
+        self.current_file: Optional[str] = None
+        self.current_parts: List[str] = []
+        self.fence_depth = 0
+        self.files: Dict[str, str] = {}
+        self._sections: List[List[str]] = []
+        self._chunks: List[str] = []
+
+    def feed(self, chunk: str) -> None:
+        """Consume a chunk of streamed text."""
+        self._chunks.append(chunk)
+        self._scan(self.buffer + chunk)
+
+    def finalize(self) -> Dict[str, str]:
+        """Flush remaining text and fill in any missing required files."""
+        if self.buffer:
+            self._scan(self.buffer + '\n')
+        if self.current_file:
+            self._close_file()
+
+        content = ''.join(self._chunks)
+        files = self.files
+
+        # Handle case where files aren't explicitly marked
+        if not files:
+            for filename, text in self._section_files().items():
+                self._emit(filename, text)
+
+        # Ensure required files exist
+        for req_file in REQUIRED_FILES:
+            if req_file not in files:
+                self._emit(req_file, generate_fallback_output(req_file, content))
+
+        return files
+
+    def _scan(self, buffer: str) -> None:
+        """Process every complete line in ``buffer``; keep the remainder."""
+        end = buffer.rfind('\n')
+        if end == -1:
+            self.buffer = buffer
+            return
+
+        prev = 0
+        for match in _MARKER_RE.finditer(buffer, 0, end):
+            if match.start() > prev:
+                self._append_text(buffer[prev:match.start()])
+            self._handle_marker(match)
+            # Skip the newline terminating the marker line
+            prev = match.end() + 1
+        if end + 1 > prev:
+            self._append_text(buffer[prev:end + 1])
+
+        # Keep only the trailing partial line
+        self.buffer = buffer[end + 1:]
+
+    def _append_text(self, text: str) -> None:
+        if self.current_file is not None:
+            self.current_parts.append(text)
+        elif self._sections:
+            self._sections[-1].append(text)
+
+    def _handle_marker(self, match: re.Match) -> None:
+        line = match.group(0)
+        fname = match.group('fname')
+        lang = match.group('lang')
+
+        if fname is not None and self.fence_depth == 0:
+            if self.current_file:
+                self._close_file()
+            filename = fname.strip('`')
+            # Default to markdown when no extension is given
+            if '.' not in filename:
                 filename = filename + '.md'
-            current_file = filename
-            current_content = []
-        elif current_file:
-            current_content.append(line)
-    
-    # Handle case where files aren't explicitly marked
-    if not files:
-        # Try to extract by common patterns
-        sections = content.split('\n## ')
-        for section in sections:
-            section = section.strip()
+            self.current_file = filename
+            self.current_parts = []
+        elif self.current_file is None:
+            section = match.group('section')
+            if section is not None:
+                self._sections.append([section.strip() + '\n'])
+            else:
+                self._append_text(line + '\n')
+        elif lang is None:
+            # "File:" or heading inside a file body is plain content
+            self.current_parts.append(line + '\n')
+        elif self.fence_depth == 0:
+            # Opening fence of the file block
+            self.fence_depth = 1
+        elif not lang:
+            self.fence_depth -= 1
+            if self.fence_depth == 0:
+                self._close_file()
+            else:
+                self.current_parts.append(line + '\n')
+        else:
+            # Nested fenced block inside the file (e.g. mermaid)
+            self.fence_depth += 1
+            self.current_parts.append(line + '\n')
+
+    def _close_file(self) -> None:
+        text = ''.join(self.current_parts)
+        if text.endswith('\n'):
+            text = text[:-1]
+        filename = self.current_file
+        self.current_file = None
+        self.current_parts = []
+        self.fence_depth = 0
+        self._emit(filename, text)
+
+    def _emit(self, filename: str, text: str) -> None:
+        self.files[filename] = text
+        if self.on_file is not None:
+            self.on_file(filename, text)
+
+    def _section_files(self) -> Dict[str, str]:
+        """Fallback: map unmarked ``## `` sections to output files."""
+        files = {}
+        for parts in self._sections:
+            section = ''.join(parts).strip()
             if section.startswith('Executive Summary'):
                 files['executive_summary.md'] = section
             elif section.startswith('Model Decomposition'):
@@ -206,16 +526,19 @@ def parse_llm_output(content: str) -> Dict[str, str]:
             elif '```mermaid' in section:
                 # Extract mermaid diagrams
                 files['diagrams.mmd'] = section
-    
-    # Ensure required files exist
-    required_files = ['executive_summary.md', 'model_decomposition.md', 
-                      'diagrams.mmd', 'viz_spec.json', 'risk_and_assumptions.md']
-    
-    for req_file in required_files:
-        if req_file not in files:
-            files[req_file] = generate_fallback_output(req_file, content)
-    
-    return files
+        return files
+
+
+def parse_llm_output(content: str) -> Dict[str, str]:
+    """Parse LLM output into separate files."""
+    parser = StreamingOutputParser()
+    parser.feed(content)
+    return parser.finalize()
+
+
+def generate_fallback_files() -> Dict[str, str]:
+    """Generate every required file from the fallback templates."""
+    return {name: generate_fallback_output(name, '') for name in REQUIRED_FILES}
 
 
 def generate_fallback_output(filename: str, content: str) -> str:
@@ -235,123 +558,27 @@ def generate_fallback_output(filename: str, content: str) -> str:
 
 def generate_fallback_executive_summary(content: str) -> str:
     """Generate executive summary from content."""
-    return f"""# Attribution Executive Summary
-
-## Overview
-
-This analysis uses a hybrid Markov-Shapley attribution model to allocate 
-conversion value across marketing channels. The model combines causal 
-measurement (Markov chains) with fair allocation (Shapley values).
-
-## Key Findings
-
-Based on the analysis of the provided IR artifact:
-
-{content[:1000]}...
-
-## Methodology
-
-- **Markov Chains**: Probabilistic path modeling with removal effects
-- **Shapley Values**: Cooperative game theory for fair credit allocation  
-- **Hybrid Blending**: α parameter balances causality vs fairness
-- **Uncertainty Quantification**: Bootstrap resampling with 90% confidence intervals
-
-## Recommendations
-
-Please refer to the detailed analysis for specific channel recommendations.
-
----
-*Generated by First-Principles Attribution Engine*
-*Analysis date: {datetime.utcnow().strftime('%Y-%m-%d')}*
-"""
+    return _TEMPLATES['executive_summary.md'].substitute(
+        content_preview=content[:1000],
+        date=datetime.utcnow().strftime('%Y-%m-%d')
+    )
 
 
 def generate_fallback_technical_breakdown(content: str) -> str:
     """Generate technical breakdown from content."""
-    return f"""# Model Decomposition: Hybrid Markov-Shapley Attribution
-
-## Model Architecture
-
-This system uses a hybrid approach combining two complementary methods:
-
-### 1. Markov Chain Analysis (Causal)
-
-The Markov model treats customer journeys as stochastic processes:
-- **States**: Channel touchpoints + CONVERSION + NULL (no conversion)
-- **Transitions**: Probability of moving from one state to another
-- **Removal Effect**: Remove a channel, measure conversion rate drop
-
-### 2. Shapley Value Calculation (Fair)
-
-Shapley values allocate credit based on game theory:
-- **Coalitions**: All possible channel subsets
-- **Marginal Contribution**: Each channel's impact on coalition value
-- **Fairness**: Axiomatic guarantee of equal contribution = equal credit
-
-### 3. Hybrid Blending (α parameter)
-
-The final attribution is: `hybrid_share = α × markov_share + (1-α) × shapley_share`
-
-## Technical Details
-
-{content[:2000]}...
-
----
-*Technical documentation - First-Principles Attribution*
-"""
+    return _TEMPLATES['model_decomposition.md'].substitute(
+        content_preview=content[:2000]
+    )
 
 
 def generate_fallback_diagrams(content: str) -> str:
     """Generate Mermaid diagrams."""
-    return """```mermaid
----
-title: Attribution Flow
----
-
-```mermaid
-flowchart TD
-    START((Customer<br/>Journey Start))
-    Search[Search]
-    Email[Email]
-    Direct[Direct]
-    Social[Social]
-    Display[Display]
-    CONVERSION((Conversion<br/>Goal))
-    NULL((No Conversion))
-
-    START --> Search
-    START --> Email
-    START --> Direct
-    START --> Social
-    START --> Display
-
-    Search --> CONVERSION
-    Email --> CONVERSION
-    Direct --> CONVERSION
-    Social --> CONVERSION
-    Display --> CONVERSION
-
-    style CONVERSION fill:#10b981,stroke:#059669,stroke-width:2px
-```
-
-```mermaid
----
-title: Attribution Comparison
----
-
-```mermaid
-xychart-beta
-    title "Channel Attribution"
-    x-axis [Search, Email, Direct, Social, Display]
-    y-axis "Share" 0.0 --> 0.5
-    bar [0.42, 0.25, 0.18, 0.10, 0.05]
-```
-"""
+    return _TEMPLATES['diagrams.mmd'].template
 
 
 def generate_fallback_viz_spec(content: str) -> str:
     """Generate visualization spec."""
-    return json.dumps({
+    return to_json({
         "$schema": "viz_spec/1.0.0",
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "charts": {
@@ -373,58 +600,39 @@ def generate_fallback_viz_spec(content: str) -> str:
             "top_channel_share": 0.42,
             "confidence_level": "90%"
         }
-    }, indent=2)
+    })
 
 
 def generate_fallback_risk_analysis(content: str) -> str:
     """Generate risk analysis."""
-    return """# Risk and Assumptions
-
-## Key Assumptions
-
-1. **First-Party Data Only**: Analysis uses only data provided
-2. **Channel Taxonomy**: Channels are correctly classified
-3. **Timestamp Accuracy**: Event ordering is correct
-4. **Conversion Tracking**: All conversions are captured
-
-## Limitations
-
-### Observational Data
-This is **observational attribution**, not causal inference:
-- Correlations ≠ Causation
-- Unobserved confounders may exist
-- Consider A/B testing for ground truth
+    return _TEMPLATES['risk_and_assumptions.md'].template
 
-### Model Assumptions
-- Markov property: Future depends only on current state
-- Independence of irrelevant alternatives (Shapley)
-- Stationary transition probabilities
 
-### Data Quality
-- Missing events may skew attribution
-- Bot traffic not filtered
-- Cross-device journeys may be broken
-
-## Sensitivity
-
-The α parameter (default=0.5) controls causality-fairness balance:
-- α=1.0: Pure Markov (causal focus)
-- α=0.0: Pure Shapley (fairness focus)
-- α=0.5: Balanced (default)
+def jsonl_frame_writer(path: Path) -> Callable[[str, str], None]:
+    """
+    Create an ``on_file`` callback that appends JSONL frames to ``path``.
 
----
-*Risk analysis - First-Principles Attribution*
-"""
+    Each completed file becomes one line ``{"file": ..., "content": ...}``,
+    so the stream can be tailed while the analysis is still generating.
+    """
+    def emit(filename: str, content: str) -> None:
+        frame = {"file": filename, "content": content}
+        if HAS_ORJSON:
+            line = orjson.dumps(frame) + b'\n'
+        else:
+            line = json.dumps(frame).encode('utf-8') + b'\n'
+        with path.open('ab') as f:
+            f.write(line)
+    return emit
 
 
 def save_outputs(files: Dict[str, str], output_dir: str) -> None:
     """Save generated files to output directory."""
-    os.makedirs(output_dir, exist_ok=True)
-    
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
     for filename, content in files.items():
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, 'w') as f:
-            f.write(content)
+        (out / filename).write_text(content, encoding='utf-8')
         print(f"  ✓ {filename}")
 
 
@@ -432,7 +640,8 @@ def generate_analysis(
     ir_filepath: str,
     output_dir: str,
     task: str = 'G',
-    use_llm: bool = True
+    use_llm: bool = True,
+    use_cache: bool = True
 ) -> str:
     """
     Main function to generate complete attribution analysis.
@@ -442,6 +651,7 @@ def generate_analysis(
         output_dir: Directory to write output files
         task: Analysis task (A-G, default G for complete analysis)
         use_llm: Whether to use LLM (if False, uses fallbacks)
+        use_cache: Whether to reuse cached LLM responses for identical prompts
     
     Returns:
         Path to output directory
@@ -465,30 +675,37 @@ def generate_analysis(
     print(f"\n[3/4] Generating analysis")
     if use_llm and HAS_ANTHROPIC:
         print("  → Calling LLM...")
+        stream_path = Path(output_dir) / 'stream.jsonl'
+        stream_path.parent.mkdir(parents=True, exist_ok=True)
+        stream_path.unlink(missing_ok=True)
+        parser = StreamingOutputParser(on_file=jsonl_frame_writer(stream_path))
+        print(f"  → Streaming completed files to {stream_path}")
+
+        def on_chunk(text: str) -> None:
+            _echo_chunk(text)
+            parser.feed(text)
+
         try:
-            response = call_llm(prompt)
-            files = parse_llm_output(response)
+            call_llm(prompt, on_chunk=on_chunk, use_cache=use_cache)
+            print()
+            files = parser.finalize()
             print("  ✓ LLM analysis complete")
         except Exception as e:
             print(f"  ⚠ LLM call failed: {e}")
             print("  → Using fallback generation")
-            files = {'content': prompt}
-            use_llm = False
+            files = generate_fallback_files()
+            # Replace any partial LLM frames so the stream matches the saved files
+            stream_path.unlink(missing_ok=True)
+            emit = jsonl_frame_writer(stream_path)
+            for filename, content in files.items():
+                emit(filename, content)
     else:
         print("  → Using fallback generation (no LLM)")
-        files = {'content': prompt}
+        files = generate_fallback_files()
     
     # Step 4: Save outputs
     print(f"\n[4/4] Saving outputs to: {output_dir}")
-    if isinstance(files, dict):
-        save_outputs(files, output_dir)
-    else:
-        # Single content response
-        os.makedirs(output_dir, exist_ok=True)
-        output_file = os.path.join(output_dir, 'analysis.md')
-        with open(output_file, 'w') as f:
-            f.write(str(files))
-        print(f"  ✓ analysis.md")
+    save_outputs(files, output_dir)
     
     print(f"\n{'='*60}")
     print(f"Analysis complete! Outputs saved to: {output_dir}")
@@ -497,6 +714,57 @@ def generate_analysis(
     return output_dir
 
 
+async def generate_all(
+    ir_filepath: str,
+    output_dir: str,
+    tasks: List[str],
+    use_llm: bool = True,
+    use_cache: bool = True
+) -> str:
+    """
+    Run several analysis tasks concurrently against one IR artifact.
+
+    Each task's outputs are written to ``<output_dir>/task_<X>``. Tasks
+    whose LLM call fails fall back to generated outputs individually.
+    """
+    print(f"\n{'='*60}")
+    print("First-Principles Attribution Analysis Generator")
+    print('='*60)
+
+    print(f"\n[1/3] Loading IR artifact: {ir_filepath}")
+    ir_data = load_ir_artifact(ir_filepath)
+    print(f"  ✓ IR version: {ir_data.get('ir_version')}")
+
+    print(f"\n[2/3] Generating analysis for tasks {', '.join(tasks)}")
+    if use_llm and HAS_ANTHROPIC:
+        print(f"  → Calling LLM ({len(tasks)} concurrent requests)...")
+        responses = await asyncio.gather(
+            *(call_llm_async(create_analysis_prompt(ir_data, t), use_cache=use_cache)
+              for t in tasks),
+            return_exceptions=True
+        )
+    else:
+        print("  → Using fallback generation (no LLM)")
+        responses = [None] * len(tasks)
+
+    print(f"\n[3/3] Saving outputs to: {output_dir}")
+    for task, response in zip(tasks, responses):
+        if isinstance(response, str):
+            files = parse_llm_output(response)
+        else:
+            if response is not None:
+                print(f"  ⚠ Task {task} LLM call failed: {response}")
+            files = generate_fallback_files()
+        print(f"  Task {task}:")
+        save_outputs(files, Path(output_dir) / f"task_{task}")
+
+    print(f"\n{'='*60}")
+    print(f"Analysis complete! Outputs saved to: {output_dir}")
+    print('='*60)
+
+    return output_dir
+
+
 def run_demo():
     """Run a demonstration with sample data."""
     print("\n" + "="*60)
@@ -559,9 +827,15 @@ def main():
     parser.add_argument(
         '--task', '-t',
         default='G',
-        choices=['A', 'B', 'C', 'D', 'E', 'F', 'G'],
+        choices=TASK_CHOICES,
         help='Analysis task (default: G for complete)'
     )
+    parser.add_argument(
+        '--tasks',
+        type=lambda v: [t.strip().upper() for t in v.split(',') if t.strip()],
+        help='Comma-separated tasks to run concurrently, e.g. A,B,C,D,E,F '
+             '(outputs go to OUTPUT/task_<X>)'
+    )
     parser.add_argument(
         '--interactive', '-i',
         action='store_true',
@@ -577,6 +851,11 @@ def main():
         action='store_true',
         help='Skip LLM call, use fallback generation'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always call the LLM, ignoring cached responses'
+    )
     
     args = parser.parse_args()
     
@@ -593,11 +872,24 @@ def main():
             return
         output_dir = input("Enter output directory [./analysis]: ").strip() or "./analysis"
         task = input("Enter task [G]: ").strip() or "G"
-        generate_analysis(ir_path, output_dir, task, use_llm=not args.no_llm)
+        generate_analysis(ir_path, output_dir, task, use_llm=not args.no_llm,
+                          use_cache=not args.no_cache)
+        return
+    
+    if args.tasks:
+        invalid = [t for t in args.tasks if t not in TASK_CHOICES]
+        if invalid:
+            parser.error(f"invalid task(s): {', '.join(invalid)}")
+    
+    if args.input and args.output and args.tasks:
+        asyncio.run(generate_all(args.input, args.output, args.tasks,
+                                 use_llm=not args.no_llm,
+                                 use_cache=not args.no_cache))
         return
     
     if args.input and args.output:
-        generate_analysis(args.input, args.output, args.task, use_llm=not args.no_llm)
+        generate_analysis(args.input, args.output, args.task, use_llm=not args.no_llm,
+                          use_cache=not args.no_cache)
         return
     
     # Show help if no arguments
@@ -34,6 +34,7 @@ from .base_adapter import (
     UniversalEvent,
     UNIVERSAL_EVENT_SCHEMA,
     validate_events,
+    iter_validation_errors,
     merge_event_streams
 )
 
@@ -44,6 +45,7 @@ from .browser_history_adapter import BrowserHistoryAdapter
 from .channel_taxonomy import (
     ChannelTaxonomy,
     normalize_channel,
+    normalize_channels,
     CHANNEL_MAPPINGS
 )
 
@@ -53,6 +55,7 @@ __all__ = [
     'UniversalEvent',
     'UNIVERSAL_EVENT_SCHEMA',
     'validate_events',
+    'iter_validation_errors',
     'merge_event_streams',
 
     # Adapters
@@ -64,5 +67,6 @@ __all__ = [
     # Taxonomy
     'ChannelTaxonomy',
     'normalize_channel',
+    'normalize_channels',
     'CHANNEL_MAPPINGS'
 ]
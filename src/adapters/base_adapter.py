@@ -13,10 +13,23 @@ The Universal Event Schema ensures:
 
 import hashlib
 import json
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict, field
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
+from dataclasses import dataclass, field
+
+# orjson is an optional speedup for event (de)serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 # Universal Event Schema Definition
@@ -75,7 +88,126 @@ UNIVERSAL_EVENT_SCHEMA = {
 }
 
 
-@dataclass
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+# Allowed UniversalEvent.event_type values (mirrors UNIVERSAL_EVENT_SCHEMA)
+_VALID_EVENT_TYPES = frozenset(
+    UNIVERSAL_EVENT_SCHEMA['properties']['event_type']['enum']
+)
+
+
+# Non-ISO timestamp formats tried by BaseAdapter.parse_timestamp
+_TIMESTAMP_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M:%S',
+)
+
+
+@lru_cache(maxsize=100_000)
+def _epoch_to_iso(timestamp: Union[int, float]) -> str:
+    """Memoized Unix timestamp -> ISO8601 behind BaseAdapter.parse_timestamp."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+@lru_cache(maxsize=100_000)
+def _parse_timestamp_str(timestamp: str) -> str:
+    """Memoized string branch of BaseAdapter.parse_timestamp."""
+    # Fast path: ISO8601 (trailing 'Z' treated as naive, as before)
+    try:
+        iso = timestamp[:-1] if timestamp.endswith('Z') else timestamp
+        return datetime.fromisoformat(iso).isoformat()
+    except ValueError:
+        pass
+    # Try common formats
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(timestamp, fmt).isoformat()
+        except ValueError:
+            continue
+    # Return as-is if can't parse
+    return timestamp
+
+
+@lru_cache(maxsize=4096)
+def _hash_user_id(raw_id: str, salt: str) -> str:
+    """Memoized hash behind BaseAdapter.hash_user_id (inputs repeat heavily)."""
+    combined = f"{raw_id}{salt}"
+    return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
+
+
+# Intent keywords, matched case-insensitively anywhere in URL or title
+_HIGH_INTENT_RE = re.compile(
+    'buy|purchase|checkout|cart|pricing|subscribe|signup|register|order|payment',
+    re.IGNORECASE
+)
+_LOW_INTENT_RE = re.compile('about|blog|news|faq|help|contact', re.IGNORECASE)
+
+
+# User agent substrings per device class, checked in this order
+_MOBILE_UA_KEYWORDS = ('iphone', 'android', 'mobile')
+_TABLET_UA_KEYWORDS = ('ipad', 'tablet')
+_DESKTOP_UA_KEYWORDS = ('windows', 'macintosh', 'linux')
+
+
+@lru_cache(maxsize=1024)
+def _classify_user_agent(user_agent: str) -> str:
+    """Device class for a user agent string (cached; few distinct UAs)."""
+    ua_lower = user_agent.lower()
+
+    if any(x in ua_lower for x in _MOBILE_UA_KEYWORDS):
+        return 'mobile'
+    elif any(x in ua_lower for x in _TABLET_UA_KEYWORDS):
+        return 'tablet'
+    elif any(x in ua_lower for x in _DESKTOP_UA_KEYWORDS):
+        return 'desktop'
+    else:
+        return 'unknown'
+
+
+def _session_depths(user_ids: List[str]) -> List[str]:
+    """Session depth per event from a time-ordered user-id column."""
+    # Running per-user position counter; one pass, no grouping lists
+    positions = defaultdict(int)
+    depths = []
+    for uid in user_ids:
+        position = positions[uid]
+        positions[uid] = position + 1
+        if position < 2:
+            depths.append('shallow')
+        elif position < 5:
+            depths.append('medium')
+        else:
+            depths.append('deep')
+    return depths
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a string read from export JSON; other values pass through.
+
+    Parsers return a fresh object for every occurrence of a value, so
+    repeated low-cardinality strings stored on each event would otherwise
+    each carry their own copy.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class UniversalEvent:
     """
     Universal event format for the attribution engine.
@@ -102,8 +234,22 @@ class UniversalEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """
+        Convert to dictionary.
+
+        ``context`` and ``metadata`` are shared with the event, not copied;
+        treat the result as read-only (use ``dataclasses.asdict`` for a deep
+        copy).
+        """
+        return {
+            'timestamp': self.timestamp,
+            'user_id': self.user_id,
+            'channel': self.channel,
+            'event_type': self.event_type,
+            'context': self.context,
+            'conversion_value': self.conversion_value,
+            'metadata': self.metadata,
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string."""
@@ -183,7 +329,7 @@ class BaseAdapter(ABC):
         """
         Create privacy-preserving user identifier.
 
-        Uses SHA256 hash to anonymize while preserving uniqueness.
+        Uses a 64-bit BLAKE2b digest to anonymize while preserving uniqueness.
 
         Parameters
         ----------
@@ -195,10 +341,37 @@ class BaseAdapter(ABC):
         Returns
         -------
         str
-            Hashed user ID (first 16 chars of hex digest)
+            Hashed user ID (16-char hex digest)
+        """
+        return _hash_user_id(raw_id, salt)
+
+    @classmethod
+    def hash_user_ids_batch(cls, raw_ids: List[str], salt: str = "") -> List[str]:
+        """
+        Hash many user identifiers at once.
+
+        Equivalent to calling ``hash_user_id`` per id, but each distinct id
+        is hashed only once and the salt is encoded once.
+
+        Parameters
+        ----------
+        raw_ids : list
+            Original user identifiers
+        salt : str
+            Optional salt for additional privacy
+
+        Returns
+        -------
+        list
+            Hashed user IDs, aligned with ``raw_ids``
         """
-        combined = f"{raw_id}{salt}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        salt_b = salt.encode()
+        blake2b = hashlib.blake2b
+        hashed = {
+            raw: blake2b(f"{raw}".encode() + salt_b, digest_size=8).hexdigest()
+            for raw in dict.fromkeys(raw_ids)
+        }
+        return [hashed[raw] for raw in raw_ids]
 
     def parse_timestamp(self, timestamp: Any) -> str:
         """
@@ -214,31 +387,14 @@ class BaseAdapter(ABC):
         str
             ISO8601 formatted timestamp
         """
+        # Exports repeat timestamps heavily; both parsers are memoized
         if isinstance(timestamp, (int, float)):
             # Unix timestamp
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.isoformat()
+            return _epoch_to_iso(timestamp)
         elif isinstance(timestamp, datetime):
             return timestamp.isoformat()
         elif isinstance(timestamp, str):
-            # Try common formats
-            formats = [
-                '%Y-%m-%dT%H:%M:%S',
-                '%Y-%m-%dT%H:%M:%S.%f',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%d %H:%M:%S',
-                '%Y/%m/%d %H:%M:%S',
-                '%d/%m/%Y %H:%M:%S',
-                '%m/%d/%Y %H:%M:%S',
-            ]
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(timestamp, fmt)
-                    return dt.isoformat()
-                except ValueError:
-                    continue
-            # Return as-is if can't parse
-            return timestamp
+            return _parse_timestamp_str(timestamp)
         else:
             return datetime.now().isoformat()
 
@@ -261,16 +417,7 @@ class BaseAdapter(ABC):
         if metadata and 'device' in metadata:
             return metadata['device'].lower()
 
-        ua_lower = user_agent.lower()
-
-        if any(x in ua_lower for x in ['iphone', 'android', 'mobile']):
-            return 'mobile'
-        elif any(x in ua_lower for x in ['ipad', 'tablet']):
-            return 'tablet'
-        elif any(x in ua_lower for x in ['windows', 'macintosh', 'linux']):
-            return 'desktop'
-        else:
-            return 'unknown'
+        return _classify_user_agent(user_agent)
 
     def infer_intent(self, event: Dict) -> str:
         """
@@ -292,23 +439,13 @@ class BaseAdapter(ABC):
         str
             'high', 'medium', 'low', or 'unknown'
         """
-        high_intent_keywords = [
-            'buy', 'purchase', 'checkout', 'cart', 'pricing',
-            'subscribe', 'signup', 'register', 'order', 'payment'
-        ]
-
-        low_intent_keywords = [
-            'about', 'blog', 'news', 'faq', 'help', 'contact'
-        ]
+        # Check URL or page title (high intent wins over low)
+        url = str(event.get('url', ''))
+        title = str(event.get('title', ''))
 
-        # Check URL or page title
-        url = str(event.get('url', '')).lower()
-        title = str(event.get('title', '')).lower()
-        combined = url + ' ' + title
-
-        if any(kw in combined for kw in high_intent_keywords):
+        if _HIGH_INTENT_RE.search(url) or _HIGH_INTENT_RE.search(title):
             return 'high'
-        elif any(kw in combined for kw in low_intent_keywords):
+        elif _LOW_INTENT_RE.search(url) or _LOW_INTENT_RE.search(title):
             return 'low'
         else:
             return 'medium'
@@ -324,7 +461,8 @@ class BaseAdapter(ABC):
         Parameters
         ----------
         user_events : list
-            All events for this user (sorted by time)
+            All events for this user (sorted by time), as dicts with at
+            least 'timestamp' and 'event_type'
         current_index : int
             Index of current event
 
@@ -362,7 +500,7 @@ class BaseAdapter(ABC):
             return False
         if not event.channel:
             return False
-        if event.event_type not in ['pageview', 'click', 'engagement', 'conversion']:
+        if event.event_type not in _VALID_EVENT_TYPES:
             return False
 
         return True
@@ -371,21 +509,27 @@ class BaseAdapter(ABC):
         """
         Export parsed events to JSON file.
 
+        Events are streamed to disk one at a time rather than building the
+        whole document in memory.
+
         Parameters
         ----------
         filepath : str
             Output file path
         """
-        output = {
-            'source': self.source_name,
-            'event_count': len(self.events),
-            'generated_at': datetime.now().isoformat(),
-            'schema_version': '1.0.0',
-            'events': [e.to_dict() for e in self.events]
-        }
-
-        with open(filepath, 'w') as f:
-            json.dump(output, f, indent=2)
+        with open(filepath, 'wb') as f:
+            header = _json_dumps({
+                'source': self.source_name,
+                'event_count': len(self.events),
+                'generated_at': datetime.now().isoformat(),
+                'schema_version': '1.0.0',
+            })
+            # Reopen the header object to append the events array
+            f.write(header[:-1] + b',"events":[')
+            for i, e in enumerate(self.events):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_json_dumps(e.to_dict()))
+            f.write(b'\n]}\n')
 
     def summary(self) -> Dict:
         """
@@ -399,28 +543,54 @@ class BaseAdapter(ABC):
         if not self.events:
             return {'error': 'No events parsed'}
 
-        channels = {}
-        event_types = {}
-        users = set()
-
-        for e in self.events:
-            channels[e.channel] = channels.get(e.channel, 0) + 1
-            event_types[e.event_type] = event_types.get(e.event_type, 0) + 1
-            users.add(e.user_id)
+        events = self.events
+        timestamps = list(map(attrgetter('timestamp'), events))
 
         return {
             'source': self.source_name,
-            'total_events': len(self.events),
-            'unique_users': len(users),
-            'channels': channels,
-            'event_types': event_types,
+            'total_events': len(events),
+            'unique_users': len(set(map(attrgetter('user_id'), events))),
+            'channels': dict(Counter(map(attrgetter('channel'), events))),
+            'event_types': dict(Counter(map(attrgetter('event_type'), events))),
             'date_range': {
-                'earliest': min(e.timestamp for e in self.events),
-                'latest': max(e.timestamp for e in self.events)
+                'earliest': min(timestamps),
+                'latest': max(timestamps)
             }
         }
 
 
+def iter_validation_errors(events: Iterable[UniversalEvent]) -> Iterator[Dict]:
+    """
+    Lazily yield validation errors for a stream of events.
+
+    Lets callers stop at the first error (e.g. ``next(iter_validation_errors(
+    events), None)``) instead of scanning every event.
+
+    Parameters
+    ----------
+    events : iterable
+        UniversalEvent objects
+
+    Yields
+    ------
+    dict
+        One validation error (index, field, error)
+    """
+    for i, event in enumerate(events):
+        if not event.timestamp:
+            yield {'index': i, 'field': 'timestamp', 'error': 'missing'}
+        if not event.user_id:
+            yield {'index': i, 'field': 'user_id', 'error': 'missing'}
+        if not event.channel:
+            yield {'index': i, 'field': 'channel', 'error': 'missing'}
+        if event.event_type not in _VALID_EVENT_TYPES:
+            yield {
+                'index': i,
+                'field': 'event_type',
+                'error': f'invalid value: {event.event_type}'
+            }
+
+
 def validate_events(events: List[UniversalEvent]) -> List[Dict]:
     """
     Validate a list of events and return validation report.
@@ -435,23 +605,11 @@ def validate_events(events: List[UniversalEvent]) -> List[Dict]:
     list
         List of validation errors (empty if all valid)
     """
-    errors = []
+    return list(iter_validation_errors(events))
 
-    for i, event in enumerate(events):
-        if not event.timestamp:
-            errors.append({'index': i, 'field': 'timestamp', 'error': 'missing'})
-        if not event.user_id:
-            errors.append({'index': i, 'field': 'user_id', 'error': 'missing'})
-        if not event.channel:
-            errors.append({'index': i, 'field': 'channel', 'error': 'missing'})
-        if event.event_type not in ['pageview', 'click', 'engagement', 'conversion']:
-            errors.append({
-                'index': i,
-                'field': 'event_type',
-                'error': f'invalid value: {event.event_type}'
-            })
 
-    return errors
+# Fields that identify the same event across streams
+_DEDUP_KEY = attrgetter('timestamp', 'user_id', 'channel', 'event_type')
 
 
 def merge_event_streams(
@@ -476,22 +634,17 @@ def merge_event_streams(
     list
         Merged event list
     """
-    merged = []
-
-    for events in event_lists:
-        merged.extend(events)
+    merged = list(chain.from_iterable(event_lists))
 
     if deduplicate:
-        seen = set()
-        unique = []
-        for e in merged:
-            key = (e.timestamp, e.user_id, e.channel, e.event_type)
-            if key not in seen:
-                seen.add(key)
-                unique.append(e)
-        merged = unique
+        # First event per key wins; dict keeps first-seen order
+        unique = {}
+        setdefault = unique.setdefault
+        for key, e in zip(map(_DEDUP_KEY, merged), merged):
+            setdefault(key, e)
+        merged = list(unique.values())
 
     if sort_by_time:
-        merged.sort(key=lambda e: e.timestamp)
+        merged.sort(key=attrgetter('timestamp'))
 
     return merged
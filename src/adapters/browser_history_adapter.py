@@ -17,17 +17,65 @@ Usage:
     events = adapter.parse()
 """
 
+import csv
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 import re
 
-from .base_adapter import BaseAdapter, UniversalEvent
+from .base_adapter import BaseAdapter, UniversalEvent, _json_loads
 from .channel_taxonomy import normalize_channel, ChannelTaxonomy
 
 
+@lru_cache(maxsize=4096)
+def _parse_query(url: str) -> Dict[str, str]:
+    """First value of each query parameter keyed by lowercased name (cached)."""
+    try:
+        query = urlsplit(url).query
+    except ValueError:
+        return {}
+    params = {}
+    for key, values in parse_qs(query).items():
+        params.setdefault(key.lower(), values[0])
+    return params
+
+
+# Intent keywords, matched case-insensitively anywhere in URL or title
+_HIGH_INTENT_RE = re.compile(
+    'checkout|purchase|buy|order|payment|pricing|subscribe|signup|register',
+    re.IGNORECASE
+)
+_LOW_INTENT_RE = re.compile(
+    'about|blog|news|faq|help|contact|terms|privacy|conditions',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _infer_url_intent(url: str, title: str) -> str:
+    """Intent signal for a (url, title) pair; cached since pages repeat."""
+    # High intent wins over low wherever either appears
+    if _HIGH_INTENT_RE.search(url) or _HIGH_INTENT_RE.search(title):
+        return 'high'
+    if _LOW_INTENT_RE.search(url) or _LOW_INTENT_RE.search(title):
+        return 'low'
+    return 'medium'
+
+
+def _session_depth(index: int) -> str:
+    """Session depth for the event at ``index`` in time order."""
+    if index < 2:
+        return 'shallow'
+    elif index < 5:
+        return 'medium'
+    return 'deep'
+
+
 class BrowserHistoryAdapter(BaseAdapter):
     """
     Adapter for browser history data exports.
@@ -50,25 +98,66 @@ class BrowserHistoryAdapter(BaseAdapter):
         self.source_name = "browser_history"
         self.browser_type = browser_type
         self.raw_data: List[Dict] = []
+        self._json_data: Any = None
         self.taxonomy = ChannelTaxonomy()
+        # Browser exports carry no user identity; every row maps to one user
+        self._user_id = self.hash_user_id('browser_user', 'history')
 
     def parse(self) -> List[UniversalEvent]:
         """Parse browser history into universal events."""
         self._detect_browser_type()
         self._load_data()
 
-        events = []
-        for item in self.raw_data:
-            event = self._convert_item(item)
-            if event:
-                events.append(event)
-
-        events.sort(key=lambda e: e.timestamp)
-        events = self._add_session_context(events)
+        # Sort the classified rows first so session depth is known when
+        # each event is built
+        rows = self._classify_items(self.raw_data)
+        rows.sort(key=itemgetter(0))
+        events = [
+            self._build_event(*row, session_depth=_session_depth(i))
+            for i, row in enumerate(rows)
+        ]
 
         self.events = events
         return events
 
+    def parse_columnar(self) -> Dict[str, List]:
+        """
+        Parse browser history into columns instead of event objects.
+
+        Produces the same values as ``parse`` (sorted by time, with session
+        depth) as one list per field, skipping per-row UniversalEvent
+        construction. Useful for large histories that feed tabular analysis.
+
+        Returns
+        -------
+        dict
+            Column name -> list of values: timestamp, user_id, channel,
+            event_type, device, intent_signal, session_depth,
+            source_platform, url, title
+        """
+        self._detect_browser_type()
+        self._load_data()
+
+        rows = self._classify_items(self.raw_data)
+        rows.sort(key=itemgetter(0))
+        n = len(rows)
+        timestamps, urls, titles, channels, intents = (
+            map(list, zip(*rows)) if rows else ([], [], [], [], [])
+        )
+
+        return {
+            'timestamp': timestamps,
+            'user_id': [self._user_id] * n,
+            'channel': channels,
+            'event_type': ['pageview'] * n,
+            'device': ['desktop'] * n,
+            'intent_signal': intents,
+            'session_depth': [_session_depth(i) for i in range(n)],
+            'source_platform': [f'browser_{self.browser_type}'] * n,
+            'url': urls,
+            'title': titles,
+        }
+
     def _detect_browser_type(self):
         """Auto-detect browser type from file structure."""
         if self.browser_type != 'auto':
@@ -78,12 +167,13 @@ class BrowserHistoryAdapter(BaseAdapter):
         if not path.exists():
             return
 
-        with open(path, 'r', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                self.browser_type = 'generic_csv'
-                return
+        try:
+            data = _json_loads(path.read_bytes())
+        except ValueError:
+            self.browser_type = 'generic_csv'
+            return
+        # Keep the parsed document so _load_json doesn't decode it again
+        self._json_data = data
 
         # Check for browser-specific structures
         if isinstance(data, list) and len(data) > 0:
@@ -112,8 +202,9 @@ class BrowserHistoryAdapter(BaseAdapter):
 
     def _load_json(self, path: Path):
         """Load JSON format browser history."""
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data, self._json_data = self._json_data, None
+        if data is None:
+            data = _json_loads(path.read_bytes())
 
         if isinstance(data, list):
             self.raw_data = data
@@ -130,46 +221,69 @@ class BrowserHistoryAdapter(BaseAdapter):
 
     def _load_csv(self, path: Path):
         """Load CSV format browser history."""
-        import csv
-
-        with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                self.raw_data.append(row)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Plain reader + zip avoids DictReader's per-row bookkeeping
+            self.raw_data.extend(dict(zip(header, row)) for row in reader if row)
 
-    def _convert_item(self, item: Dict) -> Optional[UniversalEvent]:
-        """Convert browser history item to UniversalEvent."""
-        # Extract URL
+    def _extract_fields(self, item: Dict) -> Optional[Tuple[str, str, str]]:
+        """Extract (timestamp, url, title) from an item, or None if unusable."""
         url = self._extract_url(item)
         if not url:
             return None
 
-        # Extract timestamp
         timestamp = self._extract_timestamp(item)
         if not timestamp:
             return None
 
-        # Extract title
-        title = self._extract_title(item)
+        return timestamp, url, self._extract_title(item)
+
+    def _classify_items(self, items: List[Dict]) -> List[Tuple[str, str, str, str, str]]:
+        """Extract and classify items into (timestamp, url, title, channel, intent) rows."""
+        rows = []
+        for item in items:
+            fields = self._extract_fields(item)
+            if fields:
+                timestamp, url, title = fields
+                rows.append((
+                    timestamp, url, title,
+                    self._determine_channel(url),
+                    self._infer_intent(url, title)
+                ))
+        return rows
 
-        # Determine channel from URL
-        channel = self._determine_channel(url)
+    def _convert_item(self, item: Dict) -> Optional[UniversalEvent]:
+        """Convert browser history item to UniversalEvent."""
+        rows = self._classify_items([item])
+        if not rows:
+            return None
+        return self._build_event(*rows[0])
 
+    def _build_event(
+        self,
+        timestamp: str,
+        url: str,
+        title: str,
+        channel: str,
+        intent: str,
+        session_depth: str = 'unknown'
+    ) -> UniversalEvent:
+        """Build the UniversalEvent for one classified history entry."""
         # Infer device (browser history typically desktop)
         device = 'desktop'
 
-        # Infer intent from URL and title
-        intent = self._infer_intent(url, title)
-
         return UniversalEvent(
             timestamp=timestamp,
-            user_id=self.hash_user_id('browser_user', 'history'),
+            user_id=self._user_id,
             channel=channel,
             event_type='pageview',
             context={
                 'device': device,
                 'intent_signal': intent,
-                'session_depth': 'unknown',
+                'session_depth': session_depth,
                 'source_platform': f'browser_{self.browser_type}'
             },
             conversion_value=0.0,
@@ -180,74 +294,98 @@ class BrowserHistoryAdapter(BaseAdapter):
             }
         )
 
+    _URL_FIELDS = ('URL', 'url', 'uri', 'link', 'href')
+    _TITLE_FIELDS = ('title', 'Title', 'name', 'Name')
+    _CONVERSION_KEYWORDS = ('checkout', 'purchase', 'order-confirm')
+
     def _extract_url(self, item: Dict) -> Optional[str]:
         """Extract URL from item."""
-        url_fields = ['URL', 'url', 'uri', 'link', 'href']
-
-        for field in url_fields:
+        for field in self._URL_FIELDS:
             if field in item and item[field]:
                 return str(item[field])
 
         return None
 
+    # Timestamp fields and the divisor that converts each to Unix seconds
+    _TS_FIELDS = (
+        ('visitTime', 1000),  # Chrome: milliseconds
+        ('lastVisitTime', 1000),  # Chrome new: milliseconds
+        ('visitDate', 1_000_000),  # Firefox: microseconds
+        ('date', 1),  # Generic
+        ('timestamp', 1),  # Generic Unix
+        ('time', 1000),  # Generic milliseconds
+    )
+
     def _extract_timestamp(self, item: Dict) -> Optional[str]:
         """Extract and convert timestamp."""
-        ts_fields = [
-            ('visitTime', 1000),  # Chrome: milliseconds
-            ('lastVisitTime', 1000),  # Chrome new: milliseconds
-            ('visitDate', 1),  # Firefox: microseconds
-            ('date', 1),  # Generic
-            ('timestamp', 1),  # Generic Unix
-            ('time', 1000),  # Generic milliseconds
-        ]
+        fromtimestamp = datetime.fromtimestamp
 
-        for field, multiplier in ts_fields:
-            if field in item and item[field]:
-                ts = item[field]
-                if isinstance(ts, (int, float)):
-                    ts = ts * multiplier
-                    return self.parse_timestamp(ts / 1000 if multiplier > 1 else ts)
+        for field, divisor in self._TS_FIELDS:
+            ts = item.get(field)
+            if ts and isinstance(ts, (int, float)):
+                return fromtimestamp(ts / divisor).isoformat()
 
         return None
 
     def _extract_title(self, item: Dict) -> str:
         """Extract page title."""
-        title_fields = ['title', 'Title', 'name', 'Name']
-
-        for field in title_fields:
+        for field in self._TITLE_FIELDS:
             if field in item and item[field]:
                 return str(item[field])
 
         return ''
 
-    def _determine_channel(self, url: str) -> str:
-        """Determine channel from URL."""
-        url_lower = url.lower()
+    # Domain keyword alternations, one precompiled regex per channel
+    _SEARCH_RE = re.compile('|'.join(map(re.escape, [
+        'google.com/search', 'bing.com/search', 'yahoo.com/search',
+        'duckduckgo.com', 'baidu.com', 'yandex.com'
+    ])))
+    _SOCIAL_RE = re.compile('|'.join(map(re.escape, [
+        'facebook.com', 'twitter.com', 'x.com', 'linkedin.com',
+        'instagram.com', 'pinterest.com', 'reddit.com', 'tiktok.com',
+        'youtube.com', 'tumblr.com'
+    ])))
+    _EMAIL_RE = re.compile('|'.join(map(re.escape, [
+        'mail.google.com', 'outlook.live.com', 'mail.yahoo.com',
+        'protonmail.com', 'icloud.com'
+    ])))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _classify_domain(cls, host: str) -> Optional[str]:
+        """
+        Classify a lowercased host by domain keywords (cached per host).
 
-        # Search engines
-        search_domains = [
-            'google.com/search', 'bing.com/search', 'yahoo.com/search',
-            'duckduckgo.com', 'baidu.com', 'yandex.com'
-        ]
-        if any(d in url_lower for d in search_domains):
+        ``host`` carries a ``/search`` suffix when the URL path is a search
+        results page, so engine-specific search paths still match.
+        """
+        if cls._SEARCH_RE.search(host):
             return 'Organic Search'
-
-        # Social media
-        social_domains = [
-            'facebook.com', 'twitter.com', 'x.com', 'linkedin.com',
-            'instagram.com', 'pinterest.com', 'reddit.com', 'tiktok.com',
-            'youtube.com', 'tumblr.com'
-        ]
-        if any(d in url_lower for d in social_domains):
+        if cls._SOCIAL_RE.search(host):
             return 'Organic Social'
-
-        # Email
-        email_domains = [
-            'mail.google.com', 'outlook.live.com', 'mail.yahoo.com',
-            'protonmail.com', 'icloud.com'
-        ]
-        if any(d in url_lower for d in email_domains):
+        if cls._EMAIL_RE.search(host):
             return 'Email'
+        return None
+
+    def _determine_channel(self, url: str) -> str:
+        """Determine channel from URL."""
+        url_lower = url.lower()
+
+        try:
+            parts = urlsplit(url_lower)
+        except ValueError:
+            parts = None
+        if parts is not None and parts.netloc:
+            host = parts.netloc
+            if parts.path.startswith('/search'):
+                host += '/search'
+        else:
+            # Scheme-less or unparsable URL ('google.com/search?q=x'): no
+            # netloc to key on, so match against the whole URL as before
+            host = url_lower
+        channel = self._classify_domain(host)
+        if channel:
+            return channel
 
         # Direct navigation (typed URL, bookmark)
         if url_lower.startswith('about:') or url_lower.startswith('chrome://'):
@@ -266,56 +404,18 @@ class BrowserHistoryAdapter(BaseAdapter):
         return 'Direct'
 
     def _extract_param(self, url: str, param: str) -> str:
-        """Extract URL parameter value."""
-        pattern = rf'{param}=([^&]+)'
-        match = re.search(pattern, url, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return ''
+        """Extract URL parameter value (parameter names are case-insensitive)."""
+        return _parse_query(url).get(param.lower(), '')
 
     def _infer_intent(self, url: str, title: str) -> str:
         """Infer intent signal from URL and title."""
-        content = (url + ' ' + (title or '')).lower()
-
-        # High intent
-        high_intent = [
-            'checkout', 'purchase', 'buy', 'order', 'payment',
-            'pricing', 'subscribe', 'signup', 'register'
-        ]
-        if any(kw in content for kw in high_intent):
-            return 'high'
-
-        # Low intent
-        low_intent = [
-            'about', 'blog', 'news', 'faq', 'help', 'contact',
-            'terms', 'privacy', 'conditions'
-        ]
-        if any(kw in content for kw in low_intent):
-            return 'low'
-
-        return 'medium'
-
-    def _add_session_context(
-        self,
-        events: List[UniversalEvent]
-    ) -> List[UniversalEvent]:
-        """Add session depth context."""
-        for i, event in enumerate(events):
-            if i < 2:
-                depth = 'shallow'
-            elif i < 5:
-                depth = 'medium'
-            else:
-                depth = 'deep'
-            event.context['session_depth'] = depth
-
-        return events
+        return _infer_url_intent(url, title or '')
 
     def detect_conversions(self, events: List[Dict]) -> List[Dict]:
         """Identify conversion events (rare in browser history)."""
         for event in events:
             url = event.get('url', '').lower()
-            if any(kw in url for kw in ['checkout', 'purchase', 'order-confirm']):
+            if any(kw in url for kw in self._CONVERSION_KEYWORDS):
                 event['is_conversion'] = True
             else:
                 event['is_conversion'] = False
@@ -18,9 +18,18 @@ Usage:
     normalize_channel('newsletter')       # -> 'Email'
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 
+# pyahocorasick is an optional accelerator for fuzzy keyword scanning
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 
 # Master channel taxonomy
 CHANNEL_TAXONOMY = {
@@ -54,6 +63,34 @@ CHANNEL_TAXONOMY = {
 }
 
 
+def _build_hierarchy_index(taxonomy: Dict) -> Dict[str, Tuple[str, str, str]]:
+    """Reverse index channel -> (Level1, Level2, Level3); first match wins."""
+    index = {}
+    for level1, level2_dict in taxonomy.items():
+        for level2, level3_list in level2_dict.items():
+            index.setdefault(level2, (level1, level2, level3_list[0] if level3_list else level2))
+            for level3 in level3_list:
+                index.setdefault(level3, (level1, level2, level3))
+    return index
+
+
+HIERARCHY_INDEX = _build_hierarchy_index(CHANNEL_TAXONOMY)
+
+# Sorted channel names per taxonomy level, for list_channels
+_CHANNELS_BY_LEVEL = {
+    1: tuple(sorted(CHANNEL_TAXONOMY)),
+    2: tuple(sorted({
+        level2 for level2_dict in CHANNEL_TAXONOMY.values() for level2 in level2_dict
+    })),
+    3: tuple(sorted({
+        level3
+        for level2_dict in CHANNEL_TAXONOMY.values()
+        for level3_list in level2_dict.values()
+        for level3 in level3_list
+    })),
+}
+
+
 # Source-specific mappings to normalized channels
 CHANNEL_MAPPINGS = {
     # Google Analytics medium/source mappings
@@ -148,6 +185,104 @@ CHANNEL_MAPPINGS = {
 }
 
 
+def _compile_utm_patterns(patterns: Dict[str, str]) -> Tuple[re.Pattern, List[str]]:
+    """
+    Fuse UTM patterns into one regex that reports every matching pattern.
+
+    Each pattern sits in its own lookahead group (``u0``, ``u1``, ...) so a
+    single ``finditer`` pass sees matches at every position; the caller
+    keeps the lowest group index, i.e. the first pattern in mapping order,
+    exactly as a sequential loop would.
+    """
+    fused = '|'.join(
+        f'(?=(?P<u{i}>{pattern}))' for i, pattern in enumerate(patterns)
+    )
+    return re.compile(fused or r'(?!)'), list(patterns.values())
+
+
+# Compiled once at import; see ChannelTaxonomy.__init__ for custom patterns
+COMPILED_UTM_PATTERNS = _compile_utm_patterns(CHANNEL_MAPPINGS['utm_patterns'])
+
+# Fuzzy-match keywords and the signals each one raises. _fuzzy_match scans
+# for all of them in one pass, then applies its decision tree to the set
+# of signals seen. No keyword is a prefix of another, so the single
+# lookahead scan can't hide one keyword behind another at the same offset.
+_FUZZY_KEYWORDS = {
+    'google': ('search',), 'bing': ('search',), 'yahoo': ('search',),
+    'search': ('search',),
+    'paid': ('paid_search', 'paid_social'), 'ad': ('paid_search', 'paid_social'),
+    'cpc': ('paid_search',), 'ppc': ('paid_search',),
+    'sponsored': ('paid_social',),
+    'facebook': ('social',), 'twitter': ('social',), 'linkedin': ('social',),
+    'instagram': ('social',), 'social': ('social',), 'tiktok': ('social',),
+    'email': ('email',), 'mail': ('email',), 'newsletter': ('email',),
+    'smtp': ('email',),
+    'direct': ('direct',), 'none': ('direct',), 'typed': ('direct',),
+    'bookmark': ('direct',),
+    'display': ('display',), 'banner': ('display',),
+    'programmatic': ('display',), 'dv360': ('display',),
+    'youtube': ('video',), 'video': ('video',), 'vimeo': ('video',),
+    'ctv': ('video',), 'ott': ('video',),
+}
+_FUZZY_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _FUZZY_KEYWORDS)) + '))'
+)
+
+
+if HAS_AHOCORASICK:
+    _FUZZY_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _signals in _FUZZY_KEYWORDS.items():
+        _FUZZY_AUTOMATON.add_word(_keyword, _signals)
+    _FUZZY_AUTOMATON.make_automaton()
+
+
+def _fuzzy_signals(raw: str) -> set:
+    """Set of fuzzy-match signals raised by keywords found in ``raw``."""
+    signals = set()
+    if HAS_AHOCORASICK:
+        for _, keyword_signals in _FUZZY_AUTOMATON.iter(raw):
+            signals.update(keyword_signals)
+    else:
+        for m in _FUZZY_RE.finditer(raw):
+            signals.update(_FUZZY_KEYWORDS[m.group(1)])
+    return signals
+
+
+# Ad-serving / ad-management hosts under mapped domains: they must not
+# inherit their parent's organic channel through suffix matching
+_AD_SERVING_HOSTS = (
+    'ads.google.com', 'adservice.google.com', 'adwords.google.com',
+    'ads.youtube.com', 'ads.facebook.com', 'ads.linkedin.com',
+    'ads.twitter.com', 'ads.pinterest.com', 'ads.tiktok.com',
+)
+
+
+def _build_domain_trie(domains: Dict[str, str]) -> Dict:
+    """
+    Build a reversed-label trie from a domain -> channel mapping.
+
+    ``{'google.com': 'Organic Search'}`` becomes
+    ``{'com': {'google': {None: 'Organic Search'}}}``; the ``None`` key
+    holds the channel for the domain ending at that node. Hosts in
+    ``_AD_SERVING_HOSTS`` hold ``None`` there, cutting off their parent's
+    channel (an explicit mapping for them still wins).
+    """
+    trie: Dict = {}
+    for domain, channel in chain(
+        ((host, None) for host in _AD_SERVING_HOSTS if host not in domains),
+        domains.items()
+    ):
+        node = trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        node[None] = channel
+    return trie
+
+
+# Host part of a URL: optional protocol and "www." stripped, up to first "/"
+_HOST_RE = re.compile(r'(?:https?://)?(?:www\.)?([^/]*)')
+
+
 class ChannelTaxonomy:
     """
     Channel taxonomy manager for normalizing channel names.
@@ -164,7 +299,11 @@ class ChannelTaxonomy:
         custom_mappings : dict, optional
             Additional source-specific mappings
         """
-        self.mappings = CHANNEL_MAPPINGS.copy()
+        # Copy each source table so custom mappings never leak into the
+        # module-level CHANNEL_MAPPINGS shared by every instance
+        self.mappings = {
+            source: dict(mapping) for source, mapping in CHANNEL_MAPPINGS.items()
+        }
         if custom_mappings:
             for source, mapping in custom_mappings.items():
                 if source in self.mappings:
@@ -172,6 +311,29 @@ class ChannelTaxonomy:
                 else:
                     self.mappings[source] = mapping
 
+        # Per-source lookup tables with GA as the fallback layer, so the
+        # exact-match step in normalize is a single dict probe. Only keys
+        # already in normalized form are kept: nothing else can match a
+        # lowered/stripped value, and it lets normalize probe the raw value
+        # before normalizing it
+        ga = self.mappings['ga']
+        self._lookups = {
+            source: {
+                key: channel
+                for key, channel in {**ga, **mapping}.items()
+                if key == key.strip().lower()
+            }
+            for source, mapping in self.mappings.items()
+        }
+        self._ga_lookup = self._lookups['ga']
+        self._domains = self.mappings['domains']
+        self._domain_trie = _build_domain_trie(self._domains)
+
+        if custom_mappings and 'utm_patterns' in custom_mappings:
+            self._utm_patterns = _compile_utm_patterns(self.mappings['utm_patterns'])
+        else:
+            self._utm_patterns = COMPILED_UTM_PATTERNS
+
     def normalize(
         self,
         raw_channel: str,
@@ -201,79 +363,153 @@ class ChannelTaxonomy:
         if not raw_channel:
             return 'Unknown'
 
-        raw_lower = raw_channel.lower().strip()
-
-        # Try source-specific mapping first
-        if source in self.mappings:
-            if raw_lower in self.mappings[source]:
-                return self.mappings[source][raw_lower]
-
-        # Try GA mappings (most common)
-        if raw_lower in self.mappings['ga']:
-            return self.mappings['ga'][raw_lower]
-
-        # Try domain extraction from URL
-        if url:
-            domain = self._extract_domain(url)
-            if domain in self.mappings['domains']:
-                return self.mappings['domains'][domain]
+        # Source-specific mapping, falling back to GA (most common), in one
+        # lookup against the merged table. Most exports already carry
+        # lowercase values, so try the raw string before normalizing it
+        lookup = self._lookups.get(source, self._ga_lookup)
+        channel = lookup.get(raw_channel)
+        if channel is not None:
+            return channel
+
+        # Strip first: for unpadded values strip() returns the same object,
+        # so only lower() allocates
+        raw_lower = raw_channel.strip().lower()
+        channel = lookup.get(raw_lower)
+        if channel is not None:
+            return channel
+
+        # Try domain extraction from URL (exact host)
+        domain = self._extract_domain(url) if url else ''
+        if domain:
+            channel = self._domains.get(domain)
+            if channel:
+                return channel
 
         # Try UTM campaign patterns
         if utm_campaign:
-            for pattern, channel in self.mappings['utm_patterns'].items():
-                if re.search(pattern, utm_campaign.lower()):
-                    return channel
+            utm_re, utm_channels = self._utm_patterns
+            first = None
+            for m in utm_re.finditer(utm_campaign.lower()):
+                index = int(m.lastgroup[1:])
+                if first is None or index < first:
+                    first = index
+                    if first == 0:
+                        break
+            if first is not None:
+                return utm_channels[first]
 
         # Fuzzy matching for common terms
         normalized = self._fuzzy_match(raw_lower)
         if normalized:
             return normalized
 
+        # Last resort: parent domain of the referrer host (m.facebook.com
+        # -> facebook.com), after UTM and fuzzy rules as for unknown hosts
+        if domain:
+            channel = self._match_domain(domain)
+            if channel:
+                return channel
+
         # Default to Unknown
         return 'Unknown'
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        url = url.lower()
-        # Remove protocol
-        url = re.sub(r'^https?://', '', url)
-        # Remove www
-        url = re.sub(r'^www\.', '', url)
-        # Get domain
-        domain = url.split('/')[0]
-        return domain
+        return _HOST_RE.match(url.lower()).group(1)
+
+    def _match_domain(self, domain: str) -> Optional[str]:
+        """
+        Channel for the longest known suffix of ``domain``.
+
+        Walks the reversed-label trie, so subdomains such as
+        ``m.facebook.com`` resolve through their parent domain without
+        needing their own mapping entries. Ad-serving hosts such as
+        ``ads.google.com`` resolve to None.
+        """
+        node = self._domain_trie
+        channel = None
+        for label in reversed(domain.partition(':')[0].split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            channel = node.get(None, channel)
+        return channel
 
     def _fuzzy_match(self, raw: str) -> Optional[str]:
         """Fuzzy match channel name."""
+        signals = _fuzzy_signals(raw)
+        if not signals:
+            return None
+
         # Search engine patterns
-        if any(x in raw for x in ['google', 'bing', 'yahoo', 'search']):
-            if any(x in raw for x in ['paid', 'cpc', 'ppc', 'ad']):
+        if 'search' in signals:
+            if 'paid_search' in signals:
                 return 'Paid Search'
             return 'Organic Search'
 
         # Social patterns
-        if any(x in raw for x in ['facebook', 'twitter', 'linkedin', 'instagram', 'social', 'tiktok']):
-            if any(x in raw for x in ['paid', 'ad', 'sponsored']):
+        if 'social' in signals:
+            if 'paid_social' in signals:
                 return 'Paid Social'
             return 'Organic Social'
 
-        # Email patterns
-        if any(x in raw for x in ['email', 'mail', 'newsletter', 'smtp']):
-            return 'Email'
+        # Email, direct, display and video patterns, in priority order
+        for signal, channel in (
+            ('email', 'Email'),
+            ('direct', 'Direct'),
+            ('display', 'Display'),
+            ('video', 'Video'),
+        ):
+            if signal in signals:
+                return channel
 
-        # Direct patterns
-        if any(x in raw for x in ['direct', 'none', 'typed', 'bookmark']):
-            return 'Direct'
+        return None
 
-        # Display patterns
-        if any(x in raw for x in ['display', 'banner', 'programmatic', 'dv360']):
-            return 'Display'
+    def normalize_many(
+        self,
+        raw_channels: Iterable[str],
+        source: str = 'ga',
+        utm_campaigns: Optional[Iterable[str]] = None,
+        urls: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Normalize a column of channel names to taxonomy.
 
-        # Video patterns
-        if any(x in raw for x in ['youtube', 'video', 'vimeo', 'ctv', 'ott']):
-            return 'Video'
+        Equivalent to calling ``normalize`` per value, but each distinct
+        (channel, campaign, url) combination is normalized only once and
+        the result broadcast back to every row.
 
-        return None
+        Parameters
+        ----------
+        raw_channels : iterable of str
+            Raw channel/medium/source values
+        source : str
+            Data source ('ga', 'facebook', 'domains')
+        utm_campaigns : iterable of str, optional
+            UTM campaign per row, aligned with ``raw_channels``
+        urls : iterable of str, optional
+            Referrer URL per row, aligned with ``raw_channels``
+
+        Returns
+        -------
+        list
+            Normalized channel names, aligned with ``raw_channels``
+        """
+        if utm_campaigns is None and urls is None:
+            raw_channels = list(raw_channels)
+            lut = {raw: self.normalize(raw, source) for raw in dict.fromkeys(raw_channels)}
+            return [lut[raw] for raw in raw_channels]
+
+        rows = list(zip(
+            raw_channels,
+            repeat('') if utm_campaigns is None else utm_campaigns,
+            repeat('') if urls is None else urls
+        ))
+        lut = {
+            row: self.normalize(row[0], source, row[1], row[2])
+            for row in dict.fromkeys(rows)
+        }
+        return [lut[row] for row in rows]
 
     def get_hierarchy(self, channel: str) -> Tuple[str, str, str]:
         """
@@ -284,14 +520,7 @@ class ChannelTaxonomy:
         tuple
             (Level1, Level2, Level3) or ('Unknown', 'Unknown', 'Unknown')
         """
-        for level1, level2_dict in CHANNEL_TAXONOMY.items():
-            for level2, level3_list in level2_dict.items():
-                if channel == level2:
-                    return (level1, level2, level3_list[0] if level3_list else level2)
-                if channel in level3_list:
-                    return (level1, level2, channel)
-
-        return ('Unknown', 'Unknown', channel)
+        return HIERARCHY_INDEX.get(channel, ('Unknown', 'Unknown', channel))
 
     def list_channels(self, level: int = 2) -> List[str]:
         """
@@ -307,22 +536,23 @@ class ChannelTaxonomy:
         list
             Channel names
         """
-        channels = []
+        # Any level other than 1 or 2 lists sub-channels, as before
+        return list(_CHANNELS_BY_LEVEL.get(level, _CHANNELS_BY_LEVEL[3]))
 
-        for level1, level2_dict in CHANNEL_TAXONOMY.items():
-            if level == 1:
-                channels.append(level1)
-            else:
-                for level2, level3_list in level2_dict.items():
-                    if level == 2:
-                        channels.append(level2)
-                    else:
-                        channels.extend(level3_list)
 
-        return sorted(set(channels))
+_DEFAULT_TAXONOMY: Optional[ChannelTaxonomy] = None
 
 
-# Convenience function
+def _default_taxonomy() -> ChannelTaxonomy:
+    """Shared taxonomy with the stock mappings, built on first use."""
+    global _DEFAULT_TAXONOMY
+    if _DEFAULT_TAXONOMY is None:
+        _DEFAULT_TAXONOMY = ChannelTaxonomy()
+    return _DEFAULT_TAXONOMY
+
+
+# Convenience function; cached since imports repeat a few channel values
+@lru_cache(maxsize=4096)
 def normalize_channel(
     raw_channel: str,
     source: str = 'ga',
@@ -348,8 +578,26 @@ def normalize_channel(
     str
         Normalized channel name
     """
-    taxonomy = ChannelTaxonomy()
-    return taxonomy.normalize(raw_channel, source, utm_campaign, url)
+    return _default_taxonomy().normalize(raw_channel, source, utm_campaign, url)
+
+
+def normalize_channels(raw_channels: Iterable[str], source: str = 'ga') -> List[str]:
+    """
+    Normalize a column of channel names to standard taxonomy.
+
+    Parameters
+    ----------
+    raw_channels : iterable of str
+        Raw channel names from data source
+    source : str
+        Data source ('ga', 'facebook', 'domains')
+
+    Returns
+    -------
+    list
+        Normalized channel names, aligned with ``raw_channels``
+    """
+    return _default_taxonomy().normalize_many(raw_channels, source)
 
 
 if __name__ == "__main__":
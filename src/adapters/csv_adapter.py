@@ -26,8 +26,15 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
-from .base_adapter import BaseAdapter, UniversalEvent
-from .channel_taxonomy import normalize_channel
+from .base_adapter import BaseAdapter, UniversalEvent, _session_depths
+from .channel_taxonomy import normalize_channels
+
+
+# _build_columns keys in UniversalEvent construction order
+_EVENT_COLUMNS = (
+    'timestamp', 'user_id', 'channel', 'event_type', 'device',
+    'intent_signal', 'conversion_value', 'original_row'
+)
 
 
 class CSVAdapter(BaseAdapter):
@@ -78,14 +85,9 @@ class CSVAdapter(BaseAdapter):
         """Parse CSV file into universal events."""
         self._load_csv()
 
-        events = []
-        for row in self.raw_data:
-            event = self._convert_row(row)
-            if event:
-                events.append(event)
-
-        events.sort(key=lambda e: e.timestamp)
-        events = self._add_session_context(events)
+        # Sort and assign session depth on the columns, so each event is
+        # built once with its final context
+        events = self._events_from_columns(self._sorted_columns(self.raw_data))
 
         self.events = events
         return events
@@ -94,79 +96,145 @@ class CSVAdapter(BaseAdapter):
         """Load CSV data with flexible parsing."""
         path = Path(self.source_path)
 
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Stream rows from the file instead of reading it into memory first
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f, skipinitialspace=True)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            # One dict per row instead of DictReader's two
+            for row in reader:
+                cleaned = {name: value.strip() for name, value in zip(header, row) if value}
+                if cleaned:
+                    self.raw_data.append(cleaned)
+
+    def _build_columns(self, rows: List[Dict]) -> Dict[str, List]:
+        """
+        Extract and transform CSV rows into one list per event field.
+
+        Each field is transformed in one pass over its column instead of
+        running the whole per-field pipeline for each row in turn. Rows
+        without a timestamp are skipped. Columns: timestamp, user_id,
+        channel, event_type, device, intent_signal, conversion_value,
+        original_row.
+        """
+        # Map columns using custom or default mapping; timestamp is required
+        pairs = [
+            (row, mapped)
+            for row, mapped in zip(rows, map(self._map_columns, rows))
+            if mapped.get('timestamp')
+        ]
+        originals = [row for row, _ in pairs]
+        mapped_rows = [mapped for _, mapped in pairs]
+
+        def column(field: str, default: Any) -> List:
+            return [m.get(field, default) for m in mapped_rows]
+
+        # Timestamps, channels and intents repeat heavily: each distinct
+        # value is parsed/classified once and broadcast back to every row
+        raw_timestamps = column('timestamp', None)
+        timestamp_lut = {ts: self.parse_timestamp(ts) for ts in dict.fromkeys(raw_timestamps)}
+        pages = list(zip(column('url', ''), column('title', '')))
+        intent_lut = {
+            page: self.infer_intent({'url': page[0], 'title': page[1]})
+            for page in dict.fromkeys(pages)
+        }
 
-        sniffer = csv.Sniffer()
-        has_header = sniffer.has_header(content) if self.has_header else False
+        return {
+            'timestamp': [timestamp_lut[ts] for ts in raw_timestamps],
+            'user_id': self.hash_user_ids_batch(column('user_id', 'anonymous'), 'csv'),
+            'channel': normalize_channels(column('channel', 'Direct'), 'ga'),
+            'event_type': column('event_type', 'engagement'),
+            'device': [
+                self.infer_device(user_agent=ua, metadata={'device': device})
+                for ua, device in zip(column('user_agent', ''), column('device', ''))
+            ],
+            'intent_signal': [intent_lut[page] for page in pages],
+            'conversion_value': list(
+                map(self._conversion_value, column('conversion_value', None))
+            ),
+            'original_row': originals,
+        }
 
-        reader = csv.DictReader(
-            content.splitlines(),
-            skipinitialspace=True
-        )
+    def _sorted_columns(self, rows: List[Dict]) -> Dict[str, List]:
+        """Build event columns in time order, with per-user session depth."""
+        columns = self._build_columns(rows)
+        timestamps = columns['timestamp']
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        columns = {name: [values[i] for i in order] for name, values in columns.items()}
+
+        columns['session_depth'] = _session_depths(columns['user_id'])
+        return columns
+
+    def _convert_rows(self, rows: List[Dict]) -> List[UniversalEvent]:
+        """Convert CSV rows to UniversalEvents (unsorted, depth unknown)."""
+        columns = self._build_columns(rows)
+        columns['session_depth'] = ['unknown'] * len(columns['timestamp'])
+        return self._events_from_columns(columns)
+
+    def _events_from_columns(self, columns: Dict[str, List]) -> List[UniversalEvent]:
+        """Build UniversalEvents from event columns, including session_depth."""
+        source_file = self.source_path
+
+        return [
+            UniversalEvent(
+                timestamp=timestamp,
+                user_id=user_id,
+                channel=channel,
+                event_type=event_type,
+                context={
+                    'device': device,
+                    'intent_signal': intent,
+                    'session_depth': depth,
+                    'source_platform': 'csv_import'
+                },
+                conversion_value=value,
+                metadata={
+                    'original_row': row,
+                    'source_file': source_file
+                }
+            )
+            for timestamp, user_id, channel, event_type, device, intent, value, row, depth
+            in zip(*map(columns.get, _EVENT_COLUMNS), columns['session_depth'])
+        ]
+
+    def parse_columnar(self) -> Dict[str, List]:
+        """
+        Parse CSV file into columns instead of event objects.
+
+        Produces the same values as ``parse`` (time-sorted, with per-user
+        session depth) as one list per field, skipping UniversalEvent
+        construction entirely. Useful for large imports that feed tabular
+        analysis.
+
+        Returns
+        -------
+        dict
+            Column name -> list of values: timestamp, user_id, channel,
+            event_type, device, intent_signal, session_depth,
+            source_platform, conversion_value, original_row
+        """
+        self._load_csv()
 
-        for row in reader:
-            # Clean row values
-            cleaned = {k: v.strip() for k, v in row.items() if v}
-            if cleaned:
-                self.raw_data.append(cleaned)
+        columns = self._sorted_columns(self.raw_data)
+        columns['source_platform'] = ['csv_import'] * len(columns['timestamp'])
+        return columns
 
     def _convert_row(self, row: Dict) -> Optional[UniversalEvent]:
         """Convert CSV row to UniversalEvent."""
-        # Map columns using custom or default mapping
-        mapped = self._map_columns(row)
-
-        # Required: timestamp
-        timestamp = mapped.get('timestamp')
-        if not timestamp:
-            return None
-
-        # Required: user_id
-        user_id = mapped.get('user_id', 'anonymous')
-
-        # Channel
-        channel = mapped.get('channel', 'Direct')
-
-        # Event type
-        event_type = mapped.get('event_type', 'engagement')
-
-        # Device
-        device = self.infer_device(
-            user_agent=mapped.get('user_agent', ''),
-            metadata={'device': mapped.get('device', '')}
-        )
-
-        # Intent
-        intent = self.infer_intent({
-            'url': mapped.get('url', ''),
-            'title': mapped.get('title', '')
-        })
-
-        # Conversion value
-        conversion_value = 0.0
-        if 'conversion_value' in mapped:
-            try:
-                conversion_value = float(mapped['conversion_value'])
-            except (ValueError, TypeError):
-                pass
-
-        return UniversalEvent(
-            timestamp=self.parse_timestamp(timestamp),
-            user_id=self.hash_user_id(user_id, 'csv'),
-            channel=normalize_channel(channel, 'ga'),
-            event_type=event_type,
-            context={
-                'device': device,
-                'intent_signal': intent,
-                'session_depth': 'unknown',
-                'source_platform': 'csv_import'
-            },
-            conversion_value=conversion_value,
-            metadata={
-                'original_row': row,
-                'source_file': self.source_path
-            }
-        )
+        events = self._convert_rows([row])
+        return events[0] if events else None
+
+    @staticmethod
+    def _conversion_value(raw: Any) -> float:
+        """Parse a conversion value cell, defaulting to 0.0."""
+        if raw is None:
+            return 0.0
+        try:
+            return float(raw)
+        except (ValueError, TypeError):
+            return 0.0
 
     def _map_columns(self, row: Dict) -> Dict[str, str]:
         """Apply column mapping to row."""
@@ -178,30 +246,6 @@ class CSVAdapter(BaseAdapter):
 
         return mapped
 
-    def _add_session_context(
-        self,
-        events: List[UniversalEvent]
-    ) -> List[UniversalEvent]:
-        """Add session depth context."""
-        user_events = {}
-        for i, event in enumerate(events):
-            uid = event.user_id
-            if uid not in user_events:
-                user_events[uid] = []
-            user_events[uid].append((i, event))
-
-        for uid, user_event_list in user_events.items():
-            for position, (idx, event) in enumerate(user_event_list):
-                if position < 2:
-                    depth = 'shallow'
-                elif position < 5:
-                    depth = 'medium'
-                else:
-                    depth = 'deep'
-                events[idx].context['session_depth'] = depth
-
-        return events
-
     def detect_conversions(self, events: List[Dict]) -> List[Dict]:
         """Identify conversion events."""
         for event in events:
@@ -20,14 +20,184 @@ Usage:
 """
 
 import json
+import logging
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Callable
 from pathlib import Path
 
-from .base_adapter import BaseAdapter, UniversalEvent
+from .base_adapter import (
+    BaseAdapter, UniversalEvent, _epoch_to_iso, _intern, _json_dumps,
+    _json_loads
+)
 from .channel_taxonomy import normalize_channel
 
+# ijson is optional: it lets very large off-Facebook activity files be
+# streamed instead of loaded whole
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def _any_of(words: List[str]) -> re.Pattern:
+    """One compiled alternation matching any of the given substrings."""
+    return re.compile('|'.join(map(re.escape, words)))
+
+
+# Export file-key groups (matched against the lowercased relative path)
+_ACTIVITY_RE = _any_of([
+    'your_activity', 'activity_across_facebook', 'posts_and_comments',
+    'likes_and_reactions'
+])
+_AD_RE = _any_of([
+    'ads_and_businesses', 'ad_interests', 'advertisers',
+    'your_off_facebook_activity'
+])
+_POST_RE = _any_of(['posts', 'comments', 'reactions', 'likes'])
+_OFF_FACEBOOK_RE = _any_of(['off_facebook', 'off-facebook'])
+_SEARCH_KEY_RE = _any_of(['search'])
+_MESSAGES_RE = _any_of(['messages', 'inbox'])
+
+# Business-name groups for _map_business_to_channel (lowercased names)
+_ECOM_RE = _any_of(['amazon', 'ebay', 'etsy', 'shopify'])
+_SOCIAL_RE = _any_of(['instagram', 'twitter', 'tiktok', 'pinterest'])
+_SEARCH_RE = _any_of(['google', 'bing', 'yahoo'])
+
+# Raw event types (lowercased) that detect_conversions treats as conversions
+_CONVERSION_RE = _any_of(['purchase', 'buy', 'order', 'lead', 'install'])
+
+# Raw event type (lowercased) -> universal event type / intent signal
+_CONVERSION_TYPE_RE = _any_of(['purchase', 'buy', 'order', 'checkout'])
+_CLICK_TYPE_RE = _any_of(['click', 'view', 'visit', 'page'])
+_HIGH_INTENT_TYPE_RE = _any_of([
+    'purchase', 'checkout', 'buy', 'add_to_cart', 'wishlist', 'save'
+])
+_MEDIUM_INTENT_TYPE_RE = _any_of(['view', 'click', 'visit'])
+
+
+# Event types and business names repeat across an export, so the
+# classifiers below are memoized
+
+@lru_cache(maxsize=1024)
+def _event_type_for(raw_type: str) -> str:
+    """Universal event type for a lowercased Facebook event type."""
+    if _CONVERSION_TYPE_RE.search(raw_type):
+        return 'conversion'
+    elif _CLICK_TYPE_RE.search(raw_type):
+        return 'click'
+    else:
+        return 'engagement'
+
+
+@lru_cache(maxsize=1024)
+def _intent_for(event_type: str) -> str:
+    """Intent signal for a lowercased Facebook event type."""
+    if _HIGH_INTENT_TYPE_RE.search(event_type):
+        return 'high'
+    elif _MEDIUM_INTENT_TYPE_RE.search(event_type):
+        return 'medium'
+    else:
+        return 'low'
+
+
+@lru_cache(maxsize=4096)
+def _channel_for_business(business_name: str) -> str:
+    """Channel for an off-Facebook business name (cached on the raw name)."""
+    name_lower = business_name.lower()
+
+    # E-commerce
+    if _ECOM_RE.search(name_lower):
+        return 'Referral'
+
+    # Social
+    if _SOCIAL_RE.search(name_lower):
+        return 'Organic Social'
+
+    # Search
+    if _SEARCH_RE.search(name_lower):
+        return 'Organic Search'
+
+    # Default to Paid Social (most off-Facebook activity is ad-related)
+    return 'Paid Social'
+
+
+def _make_ctx(intent_signal: str, source_platform: str) -> Dict[str, str]:
+    """Event context for Facebook events (device and depth not yet known)."""
+    return {
+        'device': 'unknown',
+        'intent_signal': intent_signal,
+        'session_depth': 'unknown',
+        'source_platform': source_platform
+    }
+
+
+# Epoch-second timestamps (most Facebook fields) skip parse_timestamp's
+# dispatch and go straight to the memoized converter
+_EPOCH_TYPES = (int, float)
+
+
+# Marker for export files that are not valid UTF-8 JSON
+_UNREADABLE = object()
+
+
+class _StreamedJSON:
+    """Stand-in for a raw_data file that is streamed at extraction time."""
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def items(self, prefix: str) -> Iterator[Any]:
+        """
+        Yield the values under an ijson prefix, one at a time.
+
+        Raises ``ijson.JSONError`` if the file turns out to be corrupt.
+        """
+        with open(self.path, 'rb') as f:
+            yield from ijson.items(f, prefix, use_float=True)
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file with a raw fd: open, fstat, one read, close."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # Short read (very large file) or the file changed size since
+            # fstat: drain the rest
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Load one export file, or _UNREADABLE if it isn't valid JSON."""
+    try:
+        # Bytes in: the JSON parser validates UTF-8 itself
+        return _json_loads(_read_bytes(path))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return _UNREADABLE
+
 
 class FacebookAdapter(BaseAdapter):
     """
@@ -37,6 +207,30 @@ class FacebookAdapter(BaseAdapter):
     This adapter handles the various export formats and structures.
     """
 
+    # Off-Facebook activity files larger than this are streamed (needs ijson)
+    STREAM_THRESHOLD = 64 * 1024 * 1024
+
+    # (file-key pattern, extractor method) per data type, in output order
+    _EXTRACTORS = (
+        (_ACTIVITY_RE, '_extract_activity_events'),
+        (_AD_RE, '_extract_ad_events'),
+        (_OFF_FACEBOOK_RE, '_extract_off_facebook_events'),
+        (_SEARCH_KEY_RE, '_extract_search_events'),
+        (_POST_RE, '_extract_post_events'),
+        (_MESSAGES_RE, '_extract_message_events'),
+    )
+
+    # Files no extractor would match (media indexes, settings, ...) are
+    # never read
+    _RELEVANT_RE = re.compile('|'.join(pattern.pattern for pattern, _ in _EXTRACTORS))
+
+    # Files any extractor besides the off-Facebook one reads; those need the
+    # whole document, so they are never streamed
+    _NON_STREAMED_RE = re.compile('|'.join(
+        pattern.pattern for pattern, _ in _EXTRACTORS
+        if pattern is not _OFF_FACEBOOK_RE
+    ))
+
     def __init__(self, source_path: str):
         """
         Initialize Facebook adapter.
@@ -49,6 +243,12 @@ class FacebookAdapter(BaseAdapter):
         super().__init__(source_path)
         self.source_name = "facebook"
         self.raw_data = {}
+        # Exports belong to one account: every event shares this user id
+        self._fb_user_hash = self.hash_user_id('facebook_user')
+        # Timestamp for entries that have none; reset by each parse()
+        self._parse_start_ts = datetime.now().timestamp()
+        # ids of raw item lists already extracted (see _first_visit)
+        self._visited = set()
 
     def parse(self) -> List[UniversalEvent]:
         """
@@ -59,34 +259,30 @@ class FacebookAdapter(BaseAdapter):
         list
             List of UniversalEvent objects
         """
+        self._parse_start_ts = datetime.now().timestamp()
+        self._visited = set()
+
         if os.path.isdir(self.source_path):
             self._load_directory()
         else:
             self._load_file(self.source_path)
 
-        # Process each data type
-        events = []
-
-        # Activity events
-        events.extend(self._parse_activity())
+        # Process each data type in one pass over the loaded files; each
+        # type keeps its own bucket so events come out grouped by type,
+        # in _EXTRACTORS order
+        extractors = [(pattern, getattr(self, name)) for pattern, name in self._EXTRACTORS]
+        buckets = [[] for _ in extractors]
 
-        # Ad interactions
-        events.extend(self._parse_ads())
-
-        # Off-Facebook activity
-        events.extend(self._parse_off_facebook())
-
-        # Search history
-        events.extend(self._parse_searches())
-
-        # Posts and interactions
-        events.extend(self._parse_posts())
+        for key, data in self.raw_data.items():
+            key_lower = key.lower()
+            for (pattern, extract), bucket in zip(extractors, buckets):
+                if pattern.search(key_lower):
+                    bucket.extend(extract(data, key))
 
-        # Messages (metadata only)
-        events.extend(self._parse_messages())
+        events = list(chain.from_iterable(buckets))
 
         # Sort by timestamp
-        events.sort(key=lambda e: e.timestamp)
+        events.sort(key=attrgetter('timestamp'))
 
         # Add session depth context
         events = self._add_session_context(events)
@@ -98,45 +294,79 @@ class FacebookAdapter(BaseAdapter):
         """Load all JSON files from Facebook export directory."""
         path = Path(self.source_path)
 
-        # Common Facebook export paths
-        json_files = list(path.rglob('*.json'))
-
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        # Common Facebook export paths, stored by relative path; only files
+        # some extractor will look at are loaded
+        json_files = []
+        rel_paths = []
+        for json_file in path.rglob('*.json'):
+            rel_path = str(json_file.relative_to(path))
+            if self._RELEVANT_RE.search(rel_path.lower()):
+                json_files.append(json_file)
+                rel_paths.append(rel_path)
+
+        # Exports hold hundreds of files: overlap their reads on a thread
+        # pool, keeping rglob order for the results
+        workers = min(32, (os.cpu_count() or 1) * 4, len(json_files) or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(self._read_export_file, json_files, rel_paths))
+
+        for rel_path, data in zip(rel_paths, loaded):
+            if data is _UNREADABLE:
+                continue
+            self.raw_data[rel_path] = data
 
-                # Store by relative path
-                rel_path = str(json_file.relative_to(path))
-                self.raw_data[rel_path] = data
+    def _read_export_file(self, json_file: Path, rel_path: str) -> Any:
+        """
+        Load one export file, deferring large off-Facebook activity files.
 
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                continue
+        Only files read by _extract_off_facebook_events alone are streamed:
+        it is the one extractor that can consume a _StreamedJSON.
+        """
+        key = rel_path.lower()
+        if (
+            HAS_IJSON
+            and _OFF_FACEBOOK_RE.search(key)
+            and not self._NON_STREAMED_RE.search(key)
+            and os.path.getsize(json_file) > self.STREAM_THRESHOLD
+        ):
+            return _StreamedJSON(json_file)
+        return _read_json_file(json_file)
 
     def _load_file(self, filepath: str):
         """Load single JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        self.raw_data['main'] = data
+        self.raw_data['main'] = _json_loads(_read_bytes(filepath))
 
-    def _parse_activity(self) -> List[UniversalEvent]:
-        """Parse general activity data."""
-        events = []
+    def _first_visit(self, source: Any) -> bool:
+        """
+        Record raw items as extracted; False if they already were.
 
-        # Look for activity files
-        activity_patterns = [
-            'your_activity',
-            'activity_across_facebook',
-            'posts_and_comments',
-            'likes_and_reactions'
-        ]
+        Some files match more than one extractor (e.g. a list under
+        ``your_activity/posts_and_comments``); each item list is turned
+        into events only once per parse. Only objects held by raw_data are
+        passed in, so their ids stay unique for the whole parse.
+        """
+        key = id(source)
+        if key in self._visited:
+            return False
+        self._visited.add(key)
+        return True
 
+    def _parse_matching(
+        self,
+        pattern: re.Pattern,
+        extract: Callable[[Any, str], List[UniversalEvent]]
+    ) -> List[UniversalEvent]:
+        """Run one extractor over every loaded file whose key matches."""
+        events = []
         for key, data in self.raw_data.items():
-            if any(p in key.lower() for p in activity_patterns):
-                events.extend(self._extract_activity_events(data, key))
-
+            if pattern.search(key.lower()):
+                events.extend(extract(data, key))
         return events
 
+    def _parse_activity(self) -> List[UniversalEvent]:
+        """Parse general activity data."""
+        return self._parse_matching(_ACTIVITY_RE, self._extract_activity_events)
+
     def _extract_activity_events(
         self,
         data: Any,
@@ -145,20 +375,26 @@ class FacebookAdapter(BaseAdapter):
         """Extract events from activity data structure."""
         events = []
 
-        # Handle different structures
+        # Handle different structures; source is the raw_data object the
+        # items come from
         if isinstance(data, list):
-            items = data
+            items = source = data
         elif isinstance(data, dict):
             # Try common keys
             for key in ['activity', 'entries', 'items', 'data', 'v2']:
                 if key in data:
-                    items = data[key]
+                    items = source = data[key]
                     break
             else:
-                items = [data]
+                items, source = [data], data
         else:
             return events
 
+        # A list file such as posts_and_comments also matches the post
+        # extractor
+        if not self._first_visit(source):
+            return events
+
         for item in items:
             if not isinstance(item, dict):
                 continue
@@ -171,20 +407,7 @@ class FacebookAdapter(BaseAdapter):
 
     def _parse_ads(self) -> List[UniversalEvent]:
         """Parse ad interaction data."""
-        events = []
-
-        ad_patterns = [
-            'ads_and_businesses',
-            'ad_interests',
-            'advertisers',
-            'your_off_facebook_activity'
-        ]
-
-        for key, data in self.raw_data.items():
-            if any(p in key.lower() for p in ad_patterns):
-                events.extend(self._extract_ad_events(data, key))
-
-        return events
+        return self._parse_matching(_AD_RE, self._extract_ad_events)
 
     def _extract_ad_events(
         self,
@@ -193,176 +416,233 @@ class FacebookAdapter(BaseAdapter):
     ) -> List[UniversalEvent]:
         """Extract ad interaction events."""
         events = []
+        now = self._parse_start_ts
 
         if isinstance(data, dict):
             # Handle advertiser interactions
             if 'advertisers_using_your_activity' in data:
-                for advertiser in data['advertisers_using_your_activity']:
-                    if isinstance(advertiser, dict):
-                        event = UniversalEvent(
-                            timestamp=self.parse_timestamp(
-                                advertiser.get('timestamp', datetime.now().timestamp())
-                            ),
-                            user_id=self.hash_user_id('facebook_user'),
-                            channel='Paid Social',
-                            event_type='click',
-                            context={
-                                'device': 'unknown',
-                                'intent_signal': 'medium',
-                                'session_depth': 'unknown',
-                                'source_platform': 'facebook'
-                            },
-                            metadata={
-                                'advertiser': advertiser.get('name', 'unknown'),
-                                'source_file': source_key
-                            }
-                        )
-                        events.append(event)
+                # Built in one comprehension: no per-event append/resize
+                events.extend([
+                    UniversalEvent(
+                        timestamp=(
+                            _epoch_to_iso(ts) if type(ts) in _EPOCH_TYPES
+                            else self.parse_timestamp(ts)
+                        ),
+                        user_id=self._fb_user_hash,
+                        channel='Paid Social',
+                        event_type='click',
+                        context=_make_ctx('medium', 'facebook'),
+                        metadata={
+                            'advertiser': advertiser.get('name', 'unknown'),
+                            'source_file': source_key
+                        }
+                    )
+                    for advertiser in data['advertisers_using_your_activity']
+                    if isinstance(advertiser, dict)
+                    for ts in (advertiser.get('timestamp', now),)
+                ])
 
             # Handle off-Facebook activity
             if 'off_facebook_activity' in data:
                 for activity in data['off_facebook_activity']:
                     if isinstance(activity, dict):
-                        for event_data in activity.get('events', []):
-                            ts = event_data.get('timestamp', datetime.now().timestamp())
-                            event = UniversalEvent(
-                                timestamp=self.parse_timestamp(ts),
-                                user_id=self.hash_user_id('facebook_user'),
-                                channel='Paid Social',
-                                event_type=self._classify_event_type(event_data),
-                                context={
-                                    'device': 'unknown',
-                                    'intent_signal': self._infer_intent_from_type(
-                                        event_data.get('type', '')
-                                    ),
-                                    'session_depth': 'unknown',
-                                    'source_platform': activity.get('name', 'unknown')
-                                },
-                                metadata={
-                                    'business': activity.get('name', 'unknown'),
-                                    'event_type': event_data.get('type', 'unknown'),
-                                    'source_file': source_key
-                                }
-                            )
-                            events.append(event)
+                        events.extend(self._extract_business_events(
+                            activity.get('name', 'unknown'),
+                            'Paid Social',
+                            activity.get('events', []),
+                            'event_type',
+                            source_key
+                        ))
 
         return events
 
     def _parse_off_facebook(self) -> List[UniversalEvent]:
         """Parse off-Facebook activity."""
+        return self._parse_matching(_OFF_FACEBOOK_RE, self._extract_off_facebook_events)
+
+    def _extract_off_facebook_events(
+        self,
+        data: Any,
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """Extract events from an off-Facebook activity file."""
+        if isinstance(data, _StreamedJSON):
+            # One business at a time straight from the file
+            try:
+                return self._off_facebook_business_events(
+                    data.items('off_facebook_activity_v2.item'), source_key
+                )
+            except ijson.JSONError as e:
+                # Skip the corrupt file as a whole, like unreadable files in
+                # _load_directory, but say so
+                logger.warning("Skipping corrupt off-Facebook file %s: %s", source_key, e)
+                return []
+
+        if isinstance(data, dict) and 'off_facebook_activity_v2' in data:
+            return self._off_facebook_business_events(
+                data['off_facebook_activity_v2'], source_key
+            )
+        return []
+
+    def _off_facebook_business_events(
+        self,
+        businesses: Iterable[Dict],
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """Events for the businesses of an ``off_facebook_activity_v2`` list."""
         events = []
 
-        for key, data in self.raw_data.items():
-            if 'off_facebook' in key.lower() or 'off-facebook' in key.lower():
-                if isinstance(data, dict) and 'off_facebook_activity_v2' in data:
-                    for business in data['off_facebook_activity_v2']:
-                        business_name = business.get('name', 'unknown')
-
-                        for event_data in business.get('events', []):
-                            ts = event_data.get('timestamp', datetime.now().timestamp())
-                            event = UniversalEvent(
-                                timestamp=self.parse_timestamp(ts),
-                                user_id=self.hash_user_id('facebook_user'),
-                                channel=self._map_business_to_channel(business_name),
-                                event_type=self._classify_event_type(event_data),
-                                context={
-                                    'device': 'unknown',
-                                    'intent_signal': self._infer_intent_from_type(
-                                        event_data.get('type', '')
-                                    ),
-                                    'session_depth': 'unknown',
-                                    'source_platform': business_name
-                                },
-                                metadata={
-                                    'business': business_name,
-                                    'raw_type': event_data.get('type', 'unknown'),
-                                    'source_file': key
-                                }
-                            )
-                            events.append(event)
+        for business in businesses:
+            business_name = business.get('name', 'unknown')
+            business_events = business.get('events', [])
+            if not business_events:
+                continue
+
+            # One channel per business, not per event
+            channel = self._map_business_to_channel(business_name)
+
+            events.extend(self._extract_business_events(
+                business_name, channel, business_events, 'raw_type', source_key
+            ))
 
         return events
 
+    def _extract_business_events(
+        self,
+        business_name: str,
+        channel: str,
+        business_events: List[Dict],
+        type_field: str,
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """
+        Build the events for one off-Facebook business.
+
+        Shared by the ``off_facebook_activity`` (ads) and
+        ``off_facebook_activity_v2`` formats, which differ only in channel
+        and in the metadata field holding the raw event type.
+        """
+        now = self._parse_start_ts
+        business_name = _intern(business_name)
+        return [
+            UniversalEvent(
+                timestamp=(
+                    _epoch_to_iso(ts) if type(ts) in _EPOCH_TYPES
+                    else self.parse_timestamp(ts)
+                ),
+                user_id=self._fb_user_hash,
+                channel=channel,
+                event_type=self._classify_event_type(event_data),
+                context=_make_ctx(
+                    self._infer_intent_from_type(event_data.get('type', '')),
+                    business_name
+                ),
+                metadata={
+                    'business': business_name,
+                    type_field: _intern(event_data.get('type', 'unknown')),
+                    'source_file': source_key
+                }
+            )
+            for event_data in business_events
+            for ts in (event_data.get('timestamp', now),)
+        ]
+
     def _parse_searches(self) -> List[UniversalEvent]:
         """Parse search history."""
-        events = []
+        return self._parse_matching(_SEARCH_KEY_RE, self._extract_search_events)
 
-        for key, data in self.raw_data.items():
-            if 'search' in key.lower():
-                if isinstance(data, dict) and 'searches_v2' in data:
-                    for search in data['searches_v2']:
-                        if isinstance(search, dict):
-                            ts = search.get('timestamp', datetime.now().timestamp())
-                            event = UniversalEvent(
-                                timestamp=self.parse_timestamp(ts),
-                                user_id=self.hash_user_id('facebook_user'),
-                                channel='Organic Social',
-                                event_type='engagement',
-                                context={
-                                    'device': 'unknown',
-                                    'intent_signal': 'high',  # Searches indicate intent
-                                    'session_depth': 'unknown',
-                                    'source_platform': 'facebook'
-                                },
-                                metadata={
-                                    'search_type': 'facebook_search',
-                                    'source_file': key
-                                }
-                            )
-                            events.append(event)
+    def _extract_search_events(
+        self,
+        data: Any,
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """Extract events from a search history file."""
+        events = []
+        now = self._parse_start_ts
+
+        if isinstance(data, dict) and 'searches_v2' in data:
+            for search in data['searches_v2']:
+                if isinstance(search, dict):
+                    ts = search.get('timestamp', now)
+                    event = UniversalEvent(
+                        timestamp=(
+                            _epoch_to_iso(ts) if type(ts) in _EPOCH_TYPES
+                            else self.parse_timestamp(ts)
+                        ),
+                        user_id=self._fb_user_hash,
+                        channel='Organic Social',
+                        event_type='engagement',
+                        context=_make_ctx('high', 'facebook'),  # Searches indicate intent
+                        metadata={
+                            'search_type': 'facebook_search',
+                            'source_file': source_key
+                        }
+                    )
+                    events.append(event)
 
         return events
 
     def _parse_posts(self) -> List[UniversalEvent]:
         """Parse posts and interactions."""
-        events = []
+        return self._parse_matching(_POST_RE, self._extract_post_events)
 
-        post_patterns = ['posts', 'comments', 'reactions', 'likes']
+    def _extract_post_events(
+        self,
+        data: Any,
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """Extract events from a posts/comments/reactions file."""
+        events = []
 
-        for key, data in self.raw_data.items():
-            if any(p in key.lower() for p in post_patterns):
-                if isinstance(data, list):
-                    for item in data:
-                        event = self._item_to_event(item, 'engagement', key)
+        if isinstance(data, list):
+            if not self._first_visit(data):
+                return events
+            for item in data:
+                event = self._item_to_event(item, 'engagement', source_key)
+                if event:
+                    events.append(event)
+        elif isinstance(data, dict):
+            for sub_key in ['posts', 'comments', 'reactions']:
+                if sub_key in data and self._first_visit(data[sub_key]):
+                    for item in data[sub_key]:
+                        event = self._item_to_event(item, 'engagement', source_key)
                         if event:
                             events.append(event)
-                elif isinstance(data, dict):
-                    for sub_key in ['posts', 'comments', 'reactions']:
-                        if sub_key in data:
-                            for item in data[sub_key]:
-                                event = self._item_to_event(item, 'engagement', key)
-                                if event:
-                                    events.append(event)
 
         return events
 
     def _parse_messages(self) -> List[UniversalEvent]:
         """Parse message metadata (not content)."""
-        events = []
+        return self._parse_matching(_MESSAGES_RE, self._extract_message_events)
 
-        for key, data in self.raw_data.items():
-            if 'messages' in key.lower() or 'inbox' in key.lower():
-                if isinstance(data, dict) and 'messages' in data:
-                    for msg in data['messages']:
-                        if isinstance(msg, dict):
-                            ts = msg.get('timestamp_ms', datetime.now().timestamp() * 1000)
-                            event = UniversalEvent(
-                                timestamp=self.parse_timestamp(ts / 1000),
-                                user_id=self.hash_user_id('facebook_user'),
-                                channel='Organic Social',
-                                event_type='engagement',
-                                context={
-                                    'device': 'unknown',
-                                    'intent_signal': 'medium',
-                                    'session_depth': 'unknown',
-                                    'source_platform': 'messenger'
-                                },
-                                metadata={
-                                    'message_type': msg.get('type', 'unknown'),
-                                    'source_file': key
-                                }
-                            )
-                            events.append(event)
+    def _extract_message_events(
+        self,
+        data: Any,
+        source_key: str
+    ) -> List[UniversalEvent]:
+        """Extract message metadata events (not content)."""
+        events = []
+        now = self._parse_start_ts
+
+        if isinstance(data, dict) and 'messages' in data:
+            for msg in data['messages']:
+                if isinstance(msg, dict):
+                    ts = msg.get('timestamp_ms', now * 1000) / 1000
+                    event = UniversalEvent(
+                        timestamp=(
+                            _epoch_to_iso(ts) if type(ts) in _EPOCH_TYPES
+                            else self.parse_timestamp(ts)
+                        ),
+                        user_id=self._fb_user_hash,
+                        channel='Organic Social',
+                        event_type='engagement',
+                        context=_make_ctx('medium', 'messenger'),
+                        metadata={
+                            'message_type': _intern(msg.get('type', 'unknown')),
+                            'source_file': source_key
+                        }
+                    )
+                    events.append(event)
 
         return events
 
@@ -386,19 +666,17 @@ class FacebookAdapter(BaseAdapter):
                 break
 
         if ts is None:
-            ts = datetime.now().timestamp()
+            ts = self._parse_start_ts
 
         return UniversalEvent(
-            timestamp=self.parse_timestamp(ts),
-            user_id=self.hash_user_id('facebook_user'),
+            timestamp=(
+                _epoch_to_iso(ts) if type(ts) in _EPOCH_TYPES
+                else self.parse_timestamp(ts)
+            ),
+            user_id=self._fb_user_hash,
             channel='Organic Social',
             event_type=default_type,
-            context={
-                'device': 'unknown',
-                'intent_signal': 'medium',
-                'session_depth': 'unknown',
-                'source_platform': 'facebook'
-            },
+            context=_make_ctx('medium', 'facebook'),
             metadata={
                 'source_file': source_key
             }
@@ -406,57 +684,28 @@ class FacebookAdapter(BaseAdapter):
 
     def _classify_event_type(self, event_data: Dict) -> str:
         """Classify Facebook event type to universal type."""
-        raw_type = str(event_data.get('type', '')).lower()
-
-        if any(x in raw_type for x in ['purchase', 'buy', 'order', 'checkout']):
-            return 'conversion'
-        elif any(x in raw_type for x in ['click', 'view', 'visit', 'page']):
-            return 'click'
-        else:
-            return 'engagement'
+        return _event_type_for(str(event_data.get('type', '')).lower())
 
     def _infer_intent_from_type(self, event_type: str) -> str:
         """Infer intent signal from event type."""
-        event_type = event_type.lower()
-
-        if any(x in event_type for x in ['purchase', 'checkout', 'buy']):
-            return 'high'
-        elif any(x in event_type for x in ['add_to_cart', 'wishlist', 'save']):
-            return 'high'
-        elif any(x in event_type for x in ['view', 'click', 'visit']):
-            return 'medium'
-        else:
-            return 'low'
+        return _intent_for(event_type.lower())
 
     def _map_business_to_channel(self, business_name: str) -> str:
         """Map business name to channel."""
-        name_lower = business_name.lower()
-
-        # E-commerce
-        if any(x in name_lower for x in ['amazon', 'ebay', 'etsy', 'shopify']):
-            return 'Referral'
-
-        # Social
-        if any(x in name_lower for x in ['instagram', 'twitter', 'tiktok', 'pinterest']):
-            return 'Organic Social'
-
-        # Search
-        if any(x in name_lower for x in ['google', 'bing', 'yahoo']):
-            return 'Organic Search'
-
-        # Default to Paid Social (most off-Facebook activity is ad-related)
-        return 'Paid Social'
+        return _channel_for_business(business_name)
 
     def _add_session_context(
         self,
         events: List[UniversalEvent]
     ) -> List[UniversalEvent]:
         """Add session depth context to events."""
-        # Group by user (in this case, single user)
+        # Group by user (in this case, single user); a slim view with the
+        # fields depth depends on, built once, not a full to_dict() per event
+        user_events = [
+            {'timestamp': e.timestamp, 'event_type': e.event_type} for e in events
+        ]
         for i, event in enumerate(events):
-            depth = self.calculate_session_depth(
-                [e.to_dict() for e in events], i
-            )
+            depth = self.calculate_session_depth(user_events, i)
             event.context['session_depth'] = depth
 
         return events
@@ -470,26 +719,31 @@ class FacebookAdapter(BaseAdapter):
         - App install events
         - Lead generation events
         """
+        # Exports use a small vocabulary of event types: classify each
+        # distinct one once
+        is_conversion_by_type = {}
         for event in events:
             raw_type = str(event.get('type', '')).lower()
-            if any(x in raw_type for x in ['purchase', 'buy', 'order', 'lead', 'install']):
-                event['is_conversion'] = True
+            is_conversion = is_conversion_by_type.get(raw_type)
+            if is_conversion is None:
+                is_conversion = is_conversion_by_type[raw_type] = bool(
+                    _CONVERSION_RE.search(raw_type)
+                )
+
+            event['is_conversion'] = is_conversion
+            if is_conversion:
                 event['event_type'] = 'conversion'
-            else:
-                event['is_conversion'] = False
 
         return events
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1:
         adapter = FacebookAdapter(sys.argv[1])
         events = adapter.parse()
         print(f"Parsed {len(events)} events")
         print()
         print("Summary:")
-        print(json.dumps(adapter.summary(), indent=2))
+        print(_json_dumps(adapter.summary(), indent=True).decode())
     else:
         print("Usage: python facebook_adapter.py <path_to_facebook_export>")
@@ -5,7 +5,7 @@ Parses GA4 data exports (BigQuery export format or JSON export)
 into universal events for attribution analysis.
 
 Supported Formats:
-- BigQuery export JSON (events_* tables)
+- BigQuery export JSON or JSONL (events_* tables)
 - Google Analytics Data API response
 - Google Takeout export
 - Custom GA4 JSON export
@@ -26,13 +26,277 @@ Usage:
 
 import json
 import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import (
+    Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
 from pathlib import Path
 
-from .base_adapter import BaseAdapter, UniversalEvent
+from .base_adapter import (
+    BaseAdapter, UniversalEvent, _epoch_to_iso, _intern, _json_dumps,
+    _json_loads, _session_depths
+)
 from .channel_taxonomy import normalize_channel, ChannelTaxonomy
 
+# ijson is optional: it lets very large single-document exports be
+# streamed event by event instead of loaded whole
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+# JSON (not JSONL) exports larger than this are streamed (needs ijson)
+STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Errors that mark an export file as unreadable
+_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+if HAS_IJSON:
+    _DECODE_ERRORS += (ijson.JSONError,)
+
+
+# GA4 event-name sets used for classification (hoisted, O(1) membership)
+_CONVERSION_EVENTS = frozenset({
+    'purchase', 'ecommerce_purchase', 'in_app_purchase',
+    'generate_lead', 'sign_up', 'complete_registration',
+    'add_payment_info', 'checkout_complete'
+})
+_CLICK_EVENTS = frozenset({
+    'click', 'select_content', 'select_item',
+    'add_to_cart', 'add_to_wishlist', 'begin_checkout'
+})
+_PAGEVIEW_EVENTS = frozenset({'page_view', 'pageview', 'screen_view'})
+_HIGH_INTENT = frozenset({
+    'add_to_cart', 'begin_checkout', 'add_payment_info',
+    'purchase', 'sign_up', 'generate_lead'
+})
+_MEDIUM_INTENT = frozenset({
+    'view_item', 'select_item', 'view_cart',
+    'view_promotion', 'select_content'
+})
+# Page-path intent tokens, matched case-insensitively in one scan
+_INTENT_PATH_RE = re.compile('cart|checkout|pricing|buy', re.IGNORECASE)
+
+
+def _event_type_for(event_name: str) -> str:
+    """Universal event type for a lowercased GA4 event name."""
+    if event_name in _CONVERSION_EVENTS or 'purchase' in event_name:
+        return 'conversion'
+    if event_name in _CLICK_EVENTS or 'click' in event_name:
+        return 'click'
+    if event_name in _PAGEVIEW_EVENTS:
+        return 'pageview'
+    return 'engagement'
+
+
+def _name_intent(event_name: str) -> Optional[str]:
+    """Intent implied by the event name alone (None: decide from page path)."""
+    if event_name in _HIGH_INTENT:
+        return 'high'
+    if event_name in _MEDIUM_INTENT:
+        return 'medium'
+    return None
+
+
+def _page_path_intent(page_path: str) -> str:
+    """Intent signal from the page path, for names that imply none."""
+    if page_path and _INTENT_PATH_RE.search(page_path):
+        return 'high'
+    return 'low'
+
+
+# Lowercased event name -> (event_type, name intent), built once at import
+_EVENT_CLASSIFICATION = {
+    name: (_event_type_for(name), _name_intent(name))
+    for name in chain(_CONVERSION_EVENTS, _CLICK_EVENTS, _PAGEVIEW_EVENTS,
+                      _HIGH_INTENT, _MEDIUM_INTENT)
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_unknown(event_name: str) -> Tuple[str, Optional[str]]:
+    """Substring-rule classification for names missing from the table."""
+    return _event_type_for(event_name), _name_intent(event_name)
+
+
+def _classify_event(event_name: str) -> Tuple[str, Optional[str]]:
+    """(event_type, name intent) for a lowercased GA4 event name."""
+    classification = _EVENT_CLASSIFICATION.get(event_name)
+    if classification is None:
+        classification = _classify_unknown(event_name)
+    return classification
+
+
+# Raw event names flagged by detect_conversions
+_DETECTED_CONVERSIONS = frozenset({
+    'purchase', 'ecommerce_purchase', 'in_app_purchase',
+    'generate_lead', 'sign_up', 'complete_registration'
+})
+
+# Prebuilt GA4 event context; _event_from_row copies it and fills the
+# per-event fields (cheaper than a fresh four-key literal)
+_CTX_TEMPLATE = {
+    'device': 'unknown',
+    'intent_signal': 'low',
+    'session_depth': 'unknown',
+    'source_platform': 'google_analytics'
+}
+
+
+# Timestamp fields tried in order by _extract_timestamp
+_TIMESTAMP_FIELDS = (
+    'event_timestamp',
+    'eventTimestamp',
+    'timestamp',
+    'event_time',
+    'dateHourMinute'
+)
+
+
+def _epoch_ts_to_iso(ts: Union[int, float]) -> str:
+    """ISO8601 for a GA4 epoch timestamp in micro-, milli- or plain seconds."""
+    if type(ts) is int:
+        # Integer split instead of float division: the whole-second part
+        # hits _epoch_to_iso's cache (events cluster within seconds) and
+        # only the sub-second digits are formatted per event
+        if ts > 10**15:  # Microseconds
+            seconds, micros = divmod(ts, 1_000_000)
+        elif ts > 10**12:  # Milliseconds
+            seconds, millis = divmod(ts, 1_000)
+            micros = millis * 1_000
+        else:
+            return _epoch_to_iso(ts)
+        iso = _epoch_to_iso(seconds)
+        return f'{iso}.{micros:06d}' if micros else iso
+
+    if ts > 1e15:  # Microseconds
+        ts = ts / 1e6
+    elif ts > 1e12:  # Milliseconds
+        ts = ts / 1e3
+    return _epoch_to_iso(ts)
+
+
+# BigQuery event_params value struct fields; exactly one is non-null
+_BQ_VALUE_FIELDS = ('string_value', 'int_value', 'double_value', 'float_value')
+
+
+def _bq_param_value(value: Dict) -> Any:
+    """First non-null field of a BigQuery event_params value struct."""
+    for field in _BQ_VALUE_FIELDS:
+        v = value.get(field)
+        if v is not None:
+            return v
+    return ''
+
+
+def _records(data: Any, nested_keys: Iterable[str]) -> Iterable[Any]:
+    """Raw events held by one parsed GA4 JSON document."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        # Handle nested structures
+        for key in nested_keys:
+            if key in data:
+                return data[key]
+        return [data]
+    return []
+
+
+def _stream_prefix(f: BinaryIO, nested_keys: Iterable[str]) -> Optional[str]:
+    """
+    ijson prefix of the event array in a JSON export, or None.
+
+    A top-level array is the event list itself. For an object, the
+    top-level keys are scanned in document order and the first one in
+    ``nested_keys`` is used as soon as it is reached, so the scan parses
+    only the document up to that key. None means there is no event array
+    to stream (or the document is invalid) and the file should be loaded
+    whole.
+    """
+    head = f.read(64).lstrip()
+    f.seek(0)
+    if head.startswith(b'['):
+        return 'item'
+    if not head.startswith(b'{'):
+        return None
+
+    nested_keys = frozenset(nested_keys)
+    try:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == '' and event == 'map_key' and value in nested_keys:
+                return f'{value}.item'
+    except ijson.JSONError:
+        pass
+    finally:
+        f.seek(0)
+    return None
+
+
+def _iter_file(filepath: Union[str, Path], nested_keys: Iterable[str]) -> Iterator[Any]:
+    """
+    Yield the raw events of one GA4 export file.
+
+    Files are read as bytes and parsed with orjson when available.
+    ``.jsonl`` files (BigQuery newline-delimited exports) are streamed one
+    line at a time instead of being loaded whole, as are JSON files over
+    ``STREAM_THRESHOLD`` when ijson is installed.
+    """
+    with open(filepath, 'rb') as f:
+        if str(filepath).endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield _json_loads(line)
+            return
+
+        if HAS_IJSON and os.fstat(f.fileno()).st_size > STREAM_THRESHOLD:
+            prefix = _stream_prefix(f, nested_keys)
+            if prefix is not None:
+                # A corrupt document raises ijson.JSONError, as the
+                # non-streamed path raises JSONDecodeError
+                yield from ijson.items(f, prefix, use_float=True)
+                return
+
+        yield from _records(_json_loads(f.read()), nested_keys)
+
+
+def _is_streamed(filepath: Path) -> bool:
+    """Whether _iter_file streams this file instead of loading it whole."""
+    if filepath.suffix == '.jsonl':
+        return True
+    return HAS_IJSON and filepath.stat().st_size > STREAM_THRESHOLD
+
+
+def _load_shard(filepath: Path) -> Optional[List[Any]]:
+    """
+    Raw events of one export file in a directory load.
+
+    Returns None for files that are streamed (JSONL, or large JSON with
+    ijson): those are iterated by the consumer so they stay constant
+    memory. Unreadable files give no events.
+    """
+    if _is_streamed(filepath):
+        return None
+    try:
+        return list(_iter_file(filepath, ('rows', 'events')))
+    except _DECODE_ERRORS:
+        return []
+
+
+def _iter_streamed_shard(filepath: Path) -> Iterator[Any]:
+    """Stream one directory shard; a decode error ends just that file."""
+    try:
+        yield from _iter_file(filepath, ('rows', 'events'))
+    except _DECODE_ERRORS:
+        return
+
 
 class GoogleAnalyticsAdapter(BaseAdapter):
     """
@@ -41,7 +305,22 @@ class GoogleAnalyticsAdapter(BaseAdapter):
     Handles BigQuery export format and various JSON export structures.
     """
 
-    def __init__(self, source_path: str):
+    # _extract_row tuple layout (parse_columnar column names)
+    _ROW_FIELDS = (
+        'timestamp', 'user_id', 'channel', 'event_type', 'device',
+        'intent_signal', 'conversion_value', 'ga_event_name',
+        'ga_session_id', 'ga_page_path'
+    )
+
+    # Threads reading/decoding export shards in directory loads
+    MAX_LOAD_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+    # Built once and shared by every instance (it only holds the stock
+    # mappings); channel lookups themselves go through the memoized
+    # normalize_channel
+    taxonomy: ChannelTaxonomy = ChannelTaxonomy()
+
+    def __init__(self, source_path: str, keep_raw: bool = False):
         """
         Initialize GA4 adapter.
 
@@ -49,11 +328,14 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         ----------
         source_path : str
             Path to GA4 export file or directory
+        keep_raw : bool
+            Keep the raw GA4 events in ``raw_data`` after parsing (default:
+            False; events are converted as they are read)
         """
         super().__init__(source_path)
         self.source_name = "google_analytics"
+        self.keep_raw = keep_raw
         self.raw_data = []
-        self.taxonomy = ChannelTaxonomy()
 
     def parse(self) -> List[UniversalEvent]:
         """
@@ -64,68 +346,53 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         list
             List of UniversalEvent objects
         """
-        # Load data
-        if os.path.isdir(self.source_path):
-            self._load_directory()
-        else:
-            self._load_file(self.source_path)
-
-        # Convert to universal events
-        events = []
+        # Convert to universal events as raw events are read
+        raw_events = self._iter_raw()
+        if self.keep_raw:
+            self.raw_data = raw_events = list(raw_events)
 
-        for raw_event in self.raw_data:
-            event = self._convert_event(raw_event)
-            if event:
-                events.append(event)
+        rows = [row for row in self._rows(raw_events) if row]
 
-        # Sort by timestamp
-        events.sort(key=lambda e: e.timestamp)
-
-        # Add session context
-        events = self._add_session_context(events)
+        # Sort the light row tuples by timestamp, derive session depth from
+        # the sorted user ids, then build each event once with its final
+        # context (no second pass over the event objects)
+        rows.sort(key=itemgetter(0))
+        depths = _session_depths(list(map(itemgetter(1), rows)))
+        events = list(map(self._event_from_row, rows, depths))
 
         self.events = events
         return events
 
-    def _load_directory(self):
-        """Load all GA4 JSON files from directory."""
+    def _iter_raw(self) -> Iterator[Any]:
+        """Yield raw GA4 events from the export file or directory lazily."""
+        if not os.path.isdir(self.source_path):
+            yield from _iter_file(self.source_path, ('rows', 'events', 'data'))
+            return
+
+        # Whole-file shards are read and decoded in a thread pool, a bounded
+        # window ahead of the consumer so only a few are held in memory.
+        # Streamed shards (JSONL, large JSON with ijson) are iterated here
+        # instead, keeping them constant memory. Events come out in rglob
+        # order
         path = Path(self.source_path)
-
-        for json_file in path.rglob('*.json'):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                if isinstance(data, list):
-                    self.raw_data.extend(data)
-                elif isinstance(data, dict):
-                    # Handle nested structures
-                    if 'rows' in data:
-                        self.raw_data.extend(data['rows'])
-                    elif 'events' in data:
-                        self.raw_data.extend(data['events'])
-                    else:
-                        self.raw_data.append(data)
-
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                continue
-
-    def _load_file(self, filepath: str):
-        """Load single GA4 JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        if isinstance(data, list):
-            self.raw_data = data
-        elif isinstance(data, dict):
-            if 'rows' in data:
-                self.raw_data = data['rows']
-            elif 'events' in data:
-                self.raw_data = data['events']
-            elif 'data' in data:
-                self.raw_data = data['data']
-            else:
-                self.raw_data = [data]
+        json_files = chain(path.rglob('*.json'), path.rglob('*.jsonl'))
+        window = self.MAX_LOAD_WORKERS
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pending = deque()
+            for json_file in json_files:
+                pending.append((json_file, executor.submit(_load_shard, json_file)))
+                if len(pending) >= window:
+                    yield from self._shard_events(*pending.popleft())
+            while pending:
+                yield from self._shard_events(*pending.popleft())
+
+    @staticmethod
+    def _shard_events(json_file: Path, loaded: Future) -> Iterator[Any]:
+        """Events of one directory shard, streaming it if it wasn't loaded."""
+        events = loaded.result()
+        if events is None:
+            return _iter_streamed_shard(json_file)
+        return iter(events)
 
     def _convert_event(self, raw: Dict) -> Optional[UniversalEvent]:
         """
@@ -140,6 +407,97 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         -------
         UniversalEvent or None
         """
+        row = self._extract_row(raw)
+        if row is None:
+            return None
+        return self._event_from_row(row)
+
+    def _event_from_row(
+        self,
+        row: Tuple,
+        session_depth: str = 'unknown'
+    ) -> UniversalEvent:
+        """Build a UniversalEvent from an ``_extract_row`` tuple."""
+        (timestamp, user_id, channel, event_type, device, intent,
+         conversion_value, event_name, session_id, page_path) = row
+
+        context = _CTX_TEMPLATE.copy()
+        context['device'] = device
+        context['intent_signal'] = intent
+        context['session_depth'] = session_depth
+
+        return UniversalEvent(
+            timestamp=timestamp,
+            user_id=user_id,
+            channel=channel,
+            event_type=event_type,
+            context=context,
+            conversion_value=conversion_value,
+            metadata={
+                'ga_event_name': event_name,
+                'ga_session_id': session_id,
+                'ga_page_path': page_path
+            }
+        )
+
+    def _rows(self, raw_events: Iterable[Any]) -> Iterator[Optional[Tuple]]:
+        """
+        Extract rows with the converter matching the export's schema.
+
+        The schema is detected once from the first record: BigQuery exports
+        (``event_timestamp`` + ``user_pseudo_id``) use ``_extract_row_bq``,
+        everything else the generic ``_extract_row``.
+        """
+        raw_events = iter(raw_events)
+        first = next(raw_events, None)
+        if first is None:
+            return iter(())
+
+        if (isinstance(first, dict) and 'event_timestamp' in first
+                and 'user_pseudo_id' in first):
+            extract = self._extract_row_bq
+        else:
+            extract = self._extract_row
+        return map(extract, chain((first,), raw_events))
+
+    def _extract_row_bq(self, raw: Dict) -> Optional[Tuple]:
+        """
+        ``_extract_row`` specialized for BigQuery export records.
+
+        Reads the snake_case BigQuery fields directly instead of probing
+        every alias; records that lack them fall back to ``_extract_row``.
+        """
+        try:
+            ts = raw['event_timestamp']
+            raw_user_id = raw['user_pseudo_id']
+            event_name = raw['event_name']
+        except (KeyError, TypeError):
+            return self._extract_row(raw)
+
+        if isinstance(ts, (int, float)):
+            timestamp = _epoch_ts_to_iso(ts)
+        else:
+            timestamp = self.parse_timestamp(ts)
+        if not timestamp:
+            return None
+
+        if raw_user_id:
+            user_id = self.hash_user_id(str(raw_user_id), 'ga')
+        else:
+            user_id = self._extract_user_id(raw)
+
+        return self._build_row(raw, timestamp, user_id, event_name)
+
+    def _extract_row(self, raw: Dict) -> Optional[Tuple]:
+        """
+        Extract every event field from a raw GA4 event.
+
+        Returns
+        -------
+        tuple or None
+            Values in ``_ROW_FIELDS`` order, or None if the event has no
+            usable timestamp
+        """
         if not isinstance(raw, dict):
             return None
 
@@ -148,64 +506,81 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         if not timestamp:
             return None
 
-        # Extract user ID
-        user_id = self._extract_user_id(raw)
-
-        # Extract channel
-        channel = self._extract_channel(raw)
+        return self._build_row(
+            raw,
+            timestamp,
+            self._extract_user_id(raw),
+            raw.get('event_name', raw.get('eventName', ''))
+        )
 
-        # Extract event type
-        event_type = self._extract_event_type(raw)
+    def _build_row(
+        self,
+        raw: Dict,
+        timestamp: str,
+        user_id: str,
+        event_name: str
+    ) -> Tuple:
+        """Assemble the ``_ROW_FIELDS`` tuple once the keys are resolved."""
+        # Flatten event_params once and share it with every extractor
+        params = self._get_event_params(raw)
+        page_path = self._get_nested(raw, 'page_location', '', params)
+
+        event_type, intent = _classify_event(event_name.lower())
+        if intent is None:
+            intent = _page_path_intent(page_path)
+
+        return (
+            timestamp,
+            user_id,
+            self._extract_channel(raw, params),
+            event_type,
+            self._extract_device(raw),
+            intent,
+            self._extract_conversion_value(raw, params),
+            # Event names and page paths repeat across millions of events
+            _intern(event_name),
+            self._get_nested(raw, 'session_id', '', params),
+            _intern(page_path),
+        )
 
-        # Extract device
-        device = self._extract_device(raw)
+    def parse_columnar(self) -> Dict[str, List]:
+        """
+        Parse GA4 export into columns instead of event objects.
 
-        # Extract intent
-        intent = self._infer_intent(raw)
+        Produces the same values as ``parse`` (time-sorted, with per-user
+        session depth) as one list per field, skipping UniversalEvent
+        construction entirely. Useful for large exports that feed tabular
+        analysis.
 
-        # Extract conversion value
-        conversion_value = self._extract_conversion_value(raw)
+        Returns
+        -------
+        dict
+            Column name -> list of values: timestamp, user_id, channel,
+            event_type, device, intent_signal, conversion_value,
+            ga_event_name, ga_session_id, ga_page_path, session_depth,
+            source_platform
+        """
+        rows = [row for row in self._rows(self._iter_raw()) if row]
+        rows.sort(key=itemgetter(0))
 
-        return UniversalEvent(
-            timestamp=timestamp,
-            user_id=user_id,
-            channel=channel,
-            event_type=event_type,
-            context={
-                'device': device,
-                'intent_signal': intent,
-                'session_depth': 'unknown',
-                'source_platform': 'google_analytics'
-            },
-            conversion_value=conversion_value,
-            metadata={
-                'ga_event_name': raw.get('event_name', raw.get('eventName', '')),
-                'ga_session_id': self._get_nested(raw, 'session_id', ''),
-                'ga_page_path': self._get_nested(raw, 'page_location', '')
-            }
-        )
+        columns = dict(zip(
+            self._ROW_FIELDS,
+            map(list, zip(*rows)) if rows else ([] for _ in self._ROW_FIELDS)
+        ))
+        columns['session_depth'] = _session_depths(columns['user_id'])
+        columns['source_platform'] = ['google_analytics'] * len(rows)
+        return columns
 
     def _extract_timestamp(self, raw: Dict) -> Optional[str]:
         """Extract and convert timestamp."""
         # Try different timestamp field names
-        ts_fields = [
-            'event_timestamp',
-            'eventTimestamp',
-            'timestamp',
-            'event_time',
-            'dateHourMinute'
-        ]
-
-        for field in ts_fields:
+        for field in _TIMESTAMP_FIELDS:
             if field in raw:
                 ts = raw[field]
 
                 # GA4 timestamps are in microseconds
                 if isinstance(ts, (int, float)):
-                    if ts > 1e15:  # Microseconds
-                        ts = ts / 1e6
-                    elif ts > 1e12:  # Milliseconds
-                        ts = ts / 1e3
+                    return _epoch_ts_to_iso(ts)
 
                 return self.parse_timestamp(ts)
 
@@ -236,7 +611,7 @@ class GoogleAnalyticsAdapter(BaseAdapter):
 
         return self.hash_user_id('unknown_ga_user', 'ga')
 
-    def _extract_channel(self, raw: Dict) -> str:
+    def _extract_channel(self, raw: Dict, params: Optional[Dict] = None) -> str:
         """Extract and normalize channel."""
         # Try traffic_source fields
         traffic_source = raw.get('traffic_source', raw.get('trafficSource', {}))
@@ -257,7 +632,8 @@ class GoogleAnalyticsAdapter(BaseAdapter):
                 return normalize_channel(str(raw[field]), 'ga')
 
         # Try event_params
-        params = self._get_event_params(raw)
+        if params is None:
+            params = self._get_event_params(raw)
         if 'source' in params:
             return normalize_channel(params['source'], 'ga')
         if 'medium' in params:
@@ -268,30 +644,7 @@ class GoogleAnalyticsAdapter(BaseAdapter):
     def _extract_event_type(self, raw: Dict) -> str:
         """Classify GA4 event to universal event type."""
         event_name = raw.get('event_name', raw.get('eventName', '')).lower()
-
-        # Conversion events
-        conversion_events = [
-            'purchase', 'ecommerce_purchase', 'in_app_purchase',
-            'generate_lead', 'sign_up', 'complete_registration',
-            'add_payment_info', 'checkout_complete'
-        ]
-        if event_name in conversion_events or 'purchase' in event_name:
-            return 'conversion'
-
-        # Click events
-        click_events = [
-            'click', 'select_content', 'select_item',
-            'add_to_cart', 'add_to_wishlist', 'begin_checkout'
-        ]
-        if event_name in click_events or 'click' in event_name:
-            return 'click'
-
-        # Pageview events
-        if event_name in ['page_view', 'pageview', 'screen_view']:
-            return 'pageview'
-
-        # Default to engagement
-        return 'engagement'
+        return _classify_event(event_name)[0]
 
     def _extract_device(self, raw: Dict) -> str:
         """Extract device category."""
@@ -300,42 +653,27 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         if isinstance(device, dict):
             category = device.get('category', device.get('deviceCategory', ''))
             if category:
-                return category.lower()
+                return sys.intern(category.lower())
 
         # Try flat fields
         if 'deviceCategory' in raw:
-            return raw['deviceCategory'].lower()
+            return sys.intern(raw['deviceCategory'].lower())
 
         return 'unknown'
 
     def _infer_intent(self, raw: Dict) -> str:
         """Infer intent signal from event context."""
         event_name = raw.get('event_name', raw.get('eventName', '')).lower()
+        intent = _classify_event(event_name)[1]
+        if intent is None:
+            intent = _page_path_intent(self._get_nested(raw, 'page_location', ''))
+        return intent
 
-        # High intent events
-        high_intent = [
-            'add_to_cart', 'begin_checkout', 'add_payment_info',
-            'purchase', 'sign_up', 'generate_lead'
-        ]
-        if event_name in high_intent:
-            return 'high'
-
-        # Medium intent events
-        medium_intent = [
-            'view_item', 'select_item', 'view_cart',
-            'view_promotion', 'select_content'
-        ]
-        if event_name in medium_intent:
-            return 'medium'
-
-        # Check page path for intent signals
-        page_path = self._get_nested(raw, 'page_location', '')
-        if any(x in page_path.lower() for x in ['cart', 'checkout', 'pricing', 'buy']):
-            return 'high'
-
-        return 'low'
-
-    def _extract_conversion_value(self, raw: Dict) -> float:
+    def _extract_conversion_value(
+        self,
+        raw: Dict,
+        params: Optional[Dict] = None
+    ) -> float:
         """Extract conversion value if present."""
         # Try ecommerce fields
         ecommerce = raw.get('ecommerce', {})
@@ -345,7 +683,8 @@ class GoogleAnalyticsAdapter(BaseAdapter):
                 return float(value)
 
         # Try event_params
-        params = self._get_event_params(raw)
+        if params is None:
+            params = self._get_event_params(raw)
         if 'value' in params:
             try:
                 return float(params['value'])
@@ -368,12 +707,19 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         if isinstance(params, list):
             result = {}
             for param in params:
-                if isinstance(param, dict) and 'key' in param:
+                # BigQuery params are always {'key', 'value'} dicts; anything
+                # else is skipped without a per-param isinstance check
+                try:
                     key = param['key']
-                    value = param.get('value', param.get('string_value', ''))
-                    if isinstance(value, dict):
-                        value = value.get('string_value', value.get('int_value', ''))
-                    result[key] = value
+                except (TypeError, KeyError):
+                    continue
+                if 'value' in param:
+                    value = param['value']
+                else:
+                    value = param.get('string_value', '')
+                if type(value) is dict:
+                    value = _bq_param_value(value)
+                result[key] = value
             return result
 
         elif isinstance(params, dict):
@@ -381,14 +727,26 @@ class GoogleAnalyticsAdapter(BaseAdapter):
 
         return {}
 
-    def _get_nested(self, raw: Dict, key: str, default: Any = None) -> Any:
-        """Get value from nested structure."""
+    def _get_nested(
+        self,
+        raw: Dict,
+        key: str,
+        default: Any = None,
+        params: Optional[Dict] = None
+    ) -> Any:
+        """
+        Get value from nested structure.
+
+        ``params`` is the event's already flattened event_params, if the
+        caller has it; otherwise they are flattened here.
+        """
         # Try direct key
         if key in raw:
             return raw[key]
 
         # Try event_params
-        params = self._get_event_params(raw)
+        if params is None:
+            params = self._get_event_params(raw)
         if key in params:
             return params[key]
 
@@ -400,45 +758,12 @@ class GoogleAnalyticsAdapter(BaseAdapter):
 
         return default
 
-    def _add_session_context(
-        self,
-        events: List[UniversalEvent]
-    ) -> List[UniversalEvent]:
-        """Add session depth context based on user journey position."""
-        # Group events by user
-        user_events = {}
-        for i, event in enumerate(events):
-            uid = event.user_id
-            if uid not in user_events:
-                user_events[uid] = []
-            user_events[uid].append((i, event))
-
-        # Calculate session depth per user
-        for uid, user_event_list in user_events.items():
-            for position, (idx, event) in enumerate(user_event_list):
-                if position < 2:
-                    depth = 'shallow'
-                elif position < 5:
-                    depth = 'medium'
-                else:
-                    depth = 'deep'
-                events[idx].context['session_depth'] = depth
-
-        return events
-
     def detect_conversions(self, events: List[Dict]) -> List[Dict]:
         """Identify conversion events in raw data."""
-        conversion_events = [
-            'purchase', 'ecommerce_purchase', 'in_app_purchase',
-            'generate_lead', 'sign_up', 'complete_registration'
-        ]
-
         for event in events:
-            event_name = event.get('event_name', '').lower()
-            if event_name in conversion_events:
-                event['is_conversion'] = True
-            else:
-                event['is_conversion'] = False
+            event['is_conversion'] = (
+                event.get('event_name', '').lower() in _DETECTED_CONVERSIONS
+            )
 
         return events
 
@@ -465,8 +790,8 @@ class GoogleAnalyticsAdapter(BaseAdapter):
         adapter = cls.__new__(cls)
         adapter.source_path = None
         adapter.source_name = "google_analytics_api"
+        adapter.keep_raw = True
         adapter.raw_data = []
-        adapter.taxonomy = ChannelTaxonomy()
 
         # Parse API response
         if 'rows' in response:
@@ -494,14 +819,12 @@ class GoogleAnalyticsAdapter(BaseAdapter):
 
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) > 1:
         adapter = GoogleAnalyticsAdapter(sys.argv[1])
         events = adapter.parse()
         print(f"Parsed {len(events)} events")
         print()
         print("Summary:")
-        print(json.dumps(adapter.summary(), indent=2))
+        print(_json_dumps(adapter.summary(), indent=True).decode())
     else:
         print("Usage: python google_analytics_adapter.py <path_to_ga4_export>")
@@ -15,37 +15,54 @@ Each method has different data requirements and assumptions.
 See individual module docstrings for details.
 """
 
-from .ab_test import (
-    ABTestAnalyzer,
-    calculate_lift,
-    calculate_statistical_significance,
-    run_ab_test_analysis
-)
-
-from .propensity_score import (
-    PropensityScoreEstimator,
-    calculate_propensity_scores,
-    match_propensity_scores,
-    estimate_ate_psm
-)
-
-from .instrumental_variables import (
-    IVEstimator,
-    two_stage_least_squares,
-    check_instrument_validity
-)
-
-from .regression_discontinuity import (
-    RDDEstimator,
-    estimate_local_average_treatment_effect,
-    plot_discontinuity
-)
-
-from .synthetic_control import (
-    SyntheticControlEstimator,
-    construct_synthetic_control,
-    estimate_treatment_effect_sc
-)
+from importlib import import_module
+
+# Public name -> submodule defining it. The submodules pull in numpy/scipy
+# (and matplotlib for plot_discontinuity), so they are imported on first
+# attribute access (PEP 562) rather than with the package.
+_LAZY = {
+    # A/B Testing
+    'ABTestAnalyzer': 'ab_test',
+    'calculate_lift': 'ab_test',
+    'calculate_statistical_significance': 'ab_test',
+    'run_ab_test_analysis': 'ab_test',
+
+    # Propensity Score Matching
+    'PropensityScoreEstimator': 'propensity_score',
+    'calculate_propensity_scores': 'propensity_score',
+    'match_propensity_scores': 'propensity_score',
+    'estimate_ate_psm': 'propensity_score',
+
+    # Instrumental Variables
+    'IVEstimator': 'instrumental_variables',
+    'two_stage_least_squares': 'instrumental_variables',
+    'check_instrument_validity': 'instrumental_variables',
+
+    # Regression Discontinuity
+    'RDDEstimator': 'regression_discontinuity',
+    'estimate_local_average_treatment_effect': 'regression_discontinuity',
+    'plot_discontinuity': 'regression_discontinuity',
+
+    # Synthetic Control
+    'SyntheticControlEstimator': 'synthetic_control',
+    'construct_synthetic_control': 'synthetic_control',
+    'estimate_treatment_effect_sc': 'synthetic_control',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # A/B Testing
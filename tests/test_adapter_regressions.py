@@ -0,0 +1,249 @@
+"""
+Adapter Regression Tests for First-Principles Attribution Engine
+Run with: python tests/test_adapter_regressions.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.adapters import (
+    BrowserHistoryAdapter,
+    ChannelTaxonomy,
+    FacebookAdapter,
+    GoogleAnalyticsAdapter,
+)
+from src.adapters import facebook_adapter, google_analytics_adapter
+
+
+def test_browser_schemeless_url_channel():
+    print("\n" + "="*60)
+    print("TEST: Browser channel for scheme-less URLs")
+    print("="*60)
+
+    adapter = BrowserHistoryAdapter('unused.json')
+
+    cases = {
+        'google.com/search?q=y': 'Organic Search',
+        'https://www.google.com/search?q=y': 'Organic Search',
+        'facebook.com/somepage': 'Organic Social',
+        'example.com/products': 'Direct',
+    }
+    for url, expected in cases.items():
+        channel = adapter._determine_channel(url)
+        assert channel == expected, f"{url}: expected {expected}, got {channel}"
+        print(f"[OK] {url} -> {channel}")
+
+    return True
+
+
+def _write_json(directory, rel_path, data):
+    path = os.path.join(directory, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
+def test_facebook_streaming_keeps_v1_off_facebook_activity():
+    print("\n" + "="*60)
+    print("TEST: Facebook large v1 off-Facebook export is not dropped")
+    print("="*60)
+
+    v1 = {'off_facebook_activity': [
+        {'name': 'Shop', 'events': [{'type': 'PURCHASE', 'timestamp': 1705315800}]}
+    ]}
+    v2 = {'off_facebook_activity_v2': [
+        {'name': 'Amazon', 'events': [{'type': 'VIEW', 'timestamp': 1705315900}]}
+    ]}
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        _write_json(export_dir, 'ads_and_businesses/your_off_facebook_activity.json', v1)
+        _write_json(export_dir, 'apps_and_websites/off_facebook_v2.json', v2)
+
+        expected = [e.to_dict() for e in FacebookAdapter(export_dir).parse()]
+
+        adapter = FacebookAdapter(export_dir)
+        adapter.STREAM_THRESHOLD = 0
+        streamed = [e.to_dict() for e in adapter.parse()]
+
+    for event in expected + streamed:
+        event.pop('timestamp', None)
+    assert len(expected) == 2, f"Expected 2 events, got {len(expected)}"
+    assert streamed == expected, "Streaming changed the parsed events"
+    print(f"[OK] {len(streamed)} events with streaming forced on")
+
+    return True
+
+
+def test_facebook_corrupt_streamed_file_is_skipped():
+    print("\n" + "="*60)
+    print("TEST: Facebook corrupt streamed file")
+    print("="*60)
+
+    if not facebook_adapter.HAS_IJSON:
+        print("[SKIP] ijson not installed")
+        return True
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'apps', 'off_facebook_v2.json')
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write('{"off_facebook_activity_v2": [{"name": "Shop", "events": [')
+
+        adapter = FacebookAdapter(export_dir)
+        adapter.STREAM_THRESHOLD = 0
+        events = adapter.parse()
+
+    assert events == [], f"Expected no events, got {len(events)}"
+    print("[OK] Corrupt streamed file skipped")
+
+    return True
+
+
+GA4_EVENTS = [
+    {"event_name": "page_view", "event_timestamp": 1705315800000000 + i,
+     "user_pseudo_id": f"user_{i % 3}",
+     "traffic_source": {"medium": "organic", "source": "google"}}
+    for i in range(20)
+]
+
+
+def test_ga4_streamed_export_matches_loaded():
+    print("\n" + "="*60)
+    print("TEST: GA4 streamed export")
+    print("="*60)
+
+    if not google_analytics_adapter.HAS_IJSON:
+        print("[SKIP] ijson not installed")
+        return True
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'export.json')
+        with open(path, 'w') as f:
+            json.dump({"rows": GA4_EVENTS, "trailer": list(range(1000))}, f)
+
+        expected = [e.to_dict() for e in GoogleAnalyticsAdapter(path).parse()]
+
+        # Count parser events to check the key scan stops at "rows"
+        parse = google_analytics_adapter.ijson.parse
+        seen = []
+
+        def counting_parse(f):
+            for item in parse(f):
+                seen.append(item)
+                yield item
+
+        threshold = google_analytics_adapter.STREAM_THRESHOLD
+        google_analytics_adapter.STREAM_THRESHOLD = 0
+        google_analytics_adapter.ijson.parse = counting_parse
+        try:
+            streamed = [e.to_dict() for e in GoogleAnalyticsAdapter(path).parse()]
+        finally:
+            google_analytics_adapter.STREAM_THRESHOLD = threshold
+            google_analytics_adapter.ijson.parse = parse
+
+    assert streamed == expected, "Streaming changed the parsed events"
+    assert len(seen) <= 3, f"Key scan read {len(seen)} parser events"
+    print(f"[OK] {len(streamed)} events, key scan stopped after {len(seen)} parser events")
+
+    return True
+
+
+def test_ga4_corrupt_streamed_export_raises():
+    print("\n" + "="*60)
+    print("TEST: GA4 corrupt streamed export")
+    print("="*60)
+
+    if not google_analytics_adapter.HAS_IJSON:
+        print("[SKIP] ijson not installed")
+        return True
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        path = os.path.join(export_dir, 'export.json')
+        with open(path, 'w') as f:
+            f.write(json.dumps({"rows": GA4_EVENTS})[:-20])
+
+        threshold = google_analytics_adapter.STREAM_THRESHOLD
+        google_analytics_adapter.STREAM_THRESHOLD = 0
+        try:
+            GoogleAnalyticsAdapter(path).parse()
+        except (ValueError, google_analytics_adapter.ijson.JSONError):
+            print("[OK] Corrupt export raised")
+        else:
+            raise AssertionError("Corrupt streamed export parsed silently")
+        finally:
+            google_analytics_adapter.STREAM_THRESHOLD = threshold
+
+    return True
+
+
+def test_ga4_directory_streams_jsonl_shards():
+    print("\n" + "="*60)
+    print("TEST: GA4 directory load keeps JSONL shards streamed")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as export_dir:
+        with open(os.path.join(export_dir, 'a.json'), 'w') as f:
+            json.dump({"rows": GA4_EVENTS[:10]}, f)
+        jsonl_path = os.path.join(export_dir, 'b.jsonl')
+        with open(jsonl_path, 'w') as f:
+            for event in GA4_EVENTS[10:15]:
+                f.write(json.dumps(event) + "\n")
+            # A bad line drops only the rest of that file
+            f.write("{not json\n")
+            f.write(json.dumps(GA4_EVENTS[15]) + "\n")
+
+        assert google_analytics_adapter._load_shard(Path(jsonl_path)) is None, \
+            "JSONL shard was loaded whole in the worker"
+
+        events = GoogleAnalyticsAdapter(export_dir).parse()
+
+    assert len(events) == 15, f"Expected 15 events, got {len(events)}"
+    print(f"[OK] Parsed {len(events)} events, JSONL shard streamed")
+
+    return True
+
+
+def test_taxonomy_domain_precedence():
+    print("\n" + "="*60)
+    print("TEST: Channel taxonomy referrer-domain precedence")
+    print("="*60)
+
+    taxonomy = ChannelTaxonomy()
+
+    cases = [
+        # Exact host mapping still wins over UTM rules
+        (('x', 'ga', 'nonbrand', 'https://www.facebook.com/'), 'Organic Social'),
+        # Subdomains only fall back to the parent after UTM and fuzzy rules
+        (('x', 'ga', 'nonbrand', 'https://m.facebook.com/'), 'Brand Search'),
+        (('x', 'ga', '', 'https://m.facebook.com/'), 'Organic Social'),
+        # Ad-serving hosts do not inherit google.com's organic channel
+        (('x', 'ga', '', 'https://ads.google.com/'), 'Unknown'),
+        (('x', 'ga', '', 'https://news.google.com/'), 'Organic Search'),
+    ]
+    for args, expected in cases:
+        channel = taxonomy.normalize(*args)
+        assert channel == expected, f"{args}: expected {expected}, got {channel}"
+        print(f"[OK] {args} -> {channel}")
+
+    return True
+
+
+if __name__ == "__main__":
+    tests = [
+        value for name, value in sorted(globals().items())
+        if name.startswith('test_') and callable(value)
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)
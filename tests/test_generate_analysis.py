@@ -0,0 +1,172 @@
+"""
+Streaming Output Parser Tests for generate_analysis.py
+Run with: python tests/test_generate_analysis.py
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import generate_analysis
+from generate_analysis import StreamingOutputParser, parse_llm_output
+
+SAMPLE_IR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_ir.json')
+
+
+MARKED_RESPONSE = """Here is the analysis.
+
+File: executive_summary.md
+```markdown
+# Executive Summary
+Paid Search drives 41% of conversions.
+## Key Findings
+File: not_a_new_file.md
+```
+
+File: `diagrams.mmd`
+```
+```mermaid
+graph LR
+  A --> B
+```
+```
+
+File: model_decomposition
+```
+Markov: 0.62
+Shapley: 0.38
+```
+trailing text without a newline"""
+
+UNMARKED_RESPONSE = """Intro line
+## Executive Summary
+Summary body.
+## Model Decomposition
+Decomposition body.
+## Risk and Assumptions
+Risks body.
+"""
+
+
+# Fallback files carry a generation timestamp
+_GENERATED_AT_RE = re.compile(r'"generated_at": "[^"]*"')
+
+
+def _stable(files):
+    return {name: _GENERATED_AT_RE.sub('', text) for name, text in files.items()}
+
+
+def _parse_in_chunks(content, size):
+    emitted = []
+    parser = StreamingOutputParser(on_file=lambda name, text: emitted.append(name))
+    for start in range(0, len(content), size):
+        parser.feed(content[start:start + size])
+    return _stable(parser.finalize()), emitted
+
+
+def test_chunking_does_not_change_files():
+    print("\n" + "="*60)
+    print("TEST: StreamingOutputParser chunk sizes")
+    print("="*60)
+
+    for content in (MARKED_RESPONSE, UNMARKED_RESPONSE):
+        expected = _stable(parse_llm_output(content))
+        _, expected_order = _parse_in_chunks(content, len(content))
+        for size in (1, 2, 3, 7, 64, len(content)):
+            files, emitted = _parse_in_chunks(content, size)
+            assert files == expected, f"Chunk size {size} changed the parsed files"
+            assert emitted == expected_order, f"Chunk size {size} changed on_file order"
+        print(f"[OK] {len(expected)} files identical for all chunk sizes")
+
+    return True
+
+
+def test_marked_files_content():
+    print("\n" + "="*60)
+    print("TEST: StreamingOutputParser file contents")
+    print("="*60)
+
+    files = parse_llm_output(MARKED_RESPONSE)
+
+    assert files['executive_summary.md'] == (
+        "# Executive Summary\n"
+        "Paid Search drives 41% of conversions.\n"
+        "## Key Findings\n"
+        "File: not_a_new_file.md"
+    ), files['executive_summary.md']
+    assert files['diagrams.mmd'] == "```mermaid\ngraph LR\n  A --> B\n```", files['diagrams.mmd']
+    assert files['model_decomposition.md'] == "Markov: 0.62\nShapley: 0.38"
+    assert 'not_a_new_file.md' not in files
+    print(f"[OK] Files: {sorted(files)}")
+
+    return True
+
+
+def test_unmarked_sections_fallback():
+    print("\n" + "="*60)
+    print("TEST: StreamingOutputParser section fallback")
+    print("="*60)
+
+    files = parse_llm_output(UNMARKED_RESPONSE)
+
+    assert files['executive_summary.md'] == "Executive Summary\nSummary body."
+    assert files['model_decomposition.md'] == "Model Decomposition\nDecomposition body."
+    assert files['risk_and_assumptions.md'] == "Risk and Assumptions\nRisks body."
+    print(f"[OK] Files: {sorted(files)}")
+
+    return True
+
+
+def test_failed_stream_is_replaced_by_fallback():
+    print("\n" + "="*60)
+    print("TEST: stream.jsonl after a failed LLM call")
+    print("="*60)
+
+    def failing_call_llm(prompt, on_chunk=None, use_cache=True):
+        on_chunk(MARKED_RESPONSE[:200])
+        raise RuntimeError("connection dropped")
+
+    has_anthropic, call_llm = generate_analysis.HAS_ANTHROPIC, generate_analysis.call_llm
+    generate_analysis.HAS_ANTHROPIC = True
+    generate_analysis.call_llm = failing_call_llm
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            generate_analysis.generate_analysis(SAMPLE_IR, output_dir)
+            with open(os.path.join(output_dir, 'stream.jsonl'), encoding='utf-8') as f:
+                frames = [json.loads(line) for line in f]
+            saved = {
+                frame['file']: open(os.path.join(output_dir, frame['file']),
+                                    encoding='utf-8').read()
+                for frame in frames
+            }
+    finally:
+        generate_analysis.HAS_ANTHROPIC = has_anthropic
+        generate_analysis.call_llm = call_llm
+
+    assert [frame['file'] for frame in frames] == list(generate_analysis.REQUIRED_FILES), \
+        f"Unexpected frames: {[frame['file'] for frame in frames]}"
+    for frame in frames:
+        assert frame['content'] == saved[frame['file']], f"{frame['file']} differs from its frame"
+    print(f"[OK] {len(frames)} fallback frames match the saved files")
+
+    return True
+
+
+if __name__ == "__main__":
+    tests = [
+        value for name, value in sorted(globals().items())
+        if name.startswith('test_') and callable(value)
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    sys.exit(1 if failed else 0)